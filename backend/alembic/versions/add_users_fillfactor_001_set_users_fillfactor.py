@@ -0,0 +1,27 @@
+"""Lower users table fillfactor for HOT updates
+
+Revision ID: add_users_fillfactor_001
+Revises: add_google_oauth_001
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_users_fillfactor_001'
+down_revision: Union[str, Sequence[str], None] = 'add_google_oauth_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Set fillfactor on users table."""
+    # Only affects newly written pages; existing pages pick it up on the next rewrite
+    op.execute("ALTER TABLE users SET (fillfactor = 80)")
+
+
+def downgrade():
+    """Restore default fillfactor on users table."""
+    op.execute("ALTER TABLE users RESET (fillfactor)")
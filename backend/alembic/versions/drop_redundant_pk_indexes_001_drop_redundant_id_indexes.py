@@ -0,0 +1,37 @@
+"""Drop redundant indexes on primary key columns
+
+Revision ID: drop_redundant_pk_indexes_001
+Revises: add_users_fillfactor_001
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'drop_redundant_pk_indexes_001'
+down_revision: Union[str, Sequence[str], None] = 'add_users_fillfactor_001'
+branch_labels = None
+depends_on = None
+
+
+# The primary key constraint already provides a unique btree on id
+REDUNDANT_ID_INDEXES = [
+    ('users', 'ix_users_id'),
+    ('diagnosis_sessions', 'ix_diagnosis_sessions_id'),
+    ('chat_messages', 'ix_chat_messages_id'),
+    ('message_feedback', 'ix_message_feedback_id'),
+]
+
+
+def upgrade():
+    """Drop secondary indexes that duplicate primary keys."""
+    for _, index_name in REDUNDANT_ID_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+def downgrade():
+    """Recreate secondary indexes on primary key columns."""
+    for table_name, index_name in REDUNDANT_ID_INDEXES:
+        op.create_index(index_name, table_name, ['id'], unique=False)
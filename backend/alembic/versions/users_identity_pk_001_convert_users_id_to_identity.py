@@ -0,0 +1,36 @@
+"""Convert users.id from serial to cached identity column
+
+Revision ID: users_identity_pk_001
+Revises: drop_redundant_pk_indexes_001
+Create Date: 2026-10-17 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'users_identity_pk_001'
+down_revision: Union[str, Sequence[str], None] = 'drop_redundant_pk_indexes_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Replace the serial sequence with GENERATED ALWAYS AS IDENTITY (CACHE 1000)."""
+    op.execute("ALTER TABLE users ALTER COLUMN id DROP DEFAULT")
+    op.execute("DROP SEQUENCE IF EXISTS users_id_seq")
+    op.execute("ALTER TABLE users ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (CACHE 1000)")
+    
+    # Continue numbering after the existing rows
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('users', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM users"
+    )
+
+
+def downgrade():
+    """Restore the serial sequence default on users.id."""
+    op.execute("ALTER TABLE users ALTER COLUMN id DROP IDENTITY IF EXISTS")
+    op.execute("CREATE SEQUENCE users_id_seq OWNED BY users.id")
+    op.execute("SELECT setval('users_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM users")
+    op.execute("ALTER TABLE users ALTER COLUMN id SET DEFAULT nextval('users_id_seq')")
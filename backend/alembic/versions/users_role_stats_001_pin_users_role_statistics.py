@@ -0,0 +1,32 @@
+"""Pin planner statistics for users.role
+
+Revision ID: users_role_stats_001
+Revises: users_identity_pk_001
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'users_role_stats_001'
+down_revision: Union[str, Sequence[str], None] = 'users_identity_pk_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Tell the planner role has exactly three values and sample it fully."""
+    # role is one of 'user', 'admin', 'super_admin'; super_admin is rare enough
+    # that default sampling can miss it entirely
+    op.execute("ALTER TABLE users ALTER COLUMN role SET (n_distinct = 3)")
+    op.execute("ALTER TABLE users ALTER COLUMN role SET STATISTICS 10000")
+    op.execute("ANALYZE users")
+
+
+def downgrade():
+    """Restore default statistics settings for users.role."""
+    op.execute("ALTER TABLE users ALTER COLUMN role RESET (n_distinct)")
+    op.execute("ALTER TABLE users ALTER COLUMN role SET STATISTICS -1")
+    op.execute("ANALYZE users")
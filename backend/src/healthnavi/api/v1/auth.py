@@ -4,73 +4,106 @@ Authentication router for HealthNavi AI CDSS.
 
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 import time
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request, Response
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
-from jose import jwt
+import bcrypt
+import httpx
+from jose import jwk, jwt
 import os
 import secrets
-import string
 from urllib.parse import urlencode
 
 from healthnavi.core.database import get_db
 from healthnavi.core.config import get_config
-from healthnavi.core.response_utils import create_success_response, create_error_response, ResponseTimer
+from healthnavi.core.response_utils import ResponseTimer
+from healthnavi.core.rate_limiter import login_rate_limiter, verification_rate_limiter, verification_resend_cooldown
 from healthnavi.models.user import User
 from healthnavi.schemas import UserCreate, UserResponse, UserUpdate, Token, LoginRequest, StandardResponse, SuccessResponse, EmailVerificationRequest, ResendVerificationRequest, ForgotPasswordRequest, ResetPasswordRequest
 
+config = get_config()
+logger = logging.getLogger(__name__)
+
 # Import email service with error handling
 try:
     from healthnavi.services.email_service import email_service
 except ImportError as e:
-    logger.warning(f"Email service not available: {e}")
+    logger.warning("Email service not available: %s", e)
     email_service = None
 
-config = get_config()
-logger = logging.getLogger(__name__)
-
 # Security configuration
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+BCRYPT_ROUNDS = 12
+BCRYPT_MAX_PASSWORD_BYTES = 72
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-router = APIRouter()
+# Build the HMAC signing key once instead of on every encode/decode
+JWT_KEY = jwk.construct(config.security.secret_key, config.security.algorithm)
+JWT_ALGORITHMS = [config.security.algorithm]
+# Signatures are verified once per token and cached; expiry is checked on every use
+JWT_DECODE_OPTIONS = {"verify_exp": False}
+ACCESS_TOKEN_EXPIRE_SECONDS = config.security.access_token_expire_minutes * 60
+
+# Shared client so Google OAuth calls reuse pooled keep-alive connections
+google_http_client = httpx.Client(timeout=10.0)
+
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
     try:
-        # Bcrypt has a 72 byte limit, truncate if necessary
-        if len(plain_password.encode('utf-8')) > 72:
-            plain_password = plain_password[:72]
-        return pwd_context.verify(plain_password, hashed_password)
+        # Bcrypt only uses the first 72 bytes of the password
+        password_bytes = plain_password.encode('utf-8')[:BCRYPT_MAX_PASSWORD_BYTES]
+        return bcrypt.checkpw(password_bytes, hashed_password.encode('utf-8'))
     except Exception as e:
-        logger.error(f"Password verification error: {e}")
+        logger.error("Password verification error: %s", e)
         return False
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    # Bcrypt has a 72 byte limit, truncate if necessary
-    if len(password.encode('utf-8')) > 72:
-        password = password[:72]
-    return pwd_context.hash(password)
+    # Bcrypt only uses the first 72 bytes of the password
+    password_bytes = password.encode('utf-8')[:BCRYPT_MAX_PASSWORD_BYTES]
+    return bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
+
+
+# Hash checked when the account is missing or has no password, to equalize login timing
+DUMMY_PASSWORD_HASH = get_password_hash(secrets.token_urlsafe(16))
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token."""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=config.security.access_token_expire_minutes)
+    expires_in = expires_delta.total_seconds() if expires_delta else ACCESS_TOKEN_EXPIRE_SECONDS
+    # Integer epoch seconds, as the exp claim is serialized anyway
+    return jwt.encode(
+        {**data, "exp": int(time.time() + expires_in)},
+        JWT_KEY,
+        algorithm=config.security.algorithm
+    )
+
+
+@lru_cache(maxsize=10_000)
+def _verified_claims(token: str) -> dict:
+    """Verify a token's signature once and cache its claims; expiry is checked per use."""
+    return jwt.decode(token, JWT_KEY, algorithms=JWT_ALGORITHMS, options=JWT_DECODE_OPTIONS)
+
+
+def get_token_subject(token: str) -> Optional[str]:
+    """Return the token's subject, or None if the token is invalid or expired."""
+    try:
+        payload = _verified_claims(token)
+    except jwt.JWTError:
+        return None
     
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, config.security.secret_key, algorithm=config.security.algorithm)
-    return encoded_jwt
+    exp = payload.get("exp")
+    if exp is not None and exp < time.time():
+        return None
+    return payload.get("sub")
 
 
 def authenticate_user(db: Session, username: str, password: str):
@@ -83,11 +116,87 @@ def authenticate_user(db: Session, username: str, password: str):
     return user
 
 
+# Columns needed to render a UserResponse, selected directly for list endpoints
+USER_RESPONSE_COLUMNS = (
+    User.id,
+    User.username,
+    User.full_name,
+    User.email,
+    User.role,
+    User.is_active,
+    User.is_email_verified,
+    User.created_at,
+    User.updated_at,
+)
+
+
+def user_to_response(user) -> UserResponse:
+    """
+    Build a UserResponse from a User instance or a USER_RESPONSE_COLUMNS row.
+    
+    Database values are already validated, so the per-field Pydantic
+    validation pass is skipped.
+    """
+    return UserResponse.model_construct(
+        id=user.id,
+        username=user.username,
+        full_name=user.full_name,
+        email=user.email,
+        role=user.role,
+        is_active=user.is_active,
+        is_email_verified=user.is_email_verified,
+        created_at=user.created_at or "",
+        updated_at=user.updated_at or ""
+    )
+
+
 def get_user_by_email(db: Session, email: str):
     """Get user by email."""
     return db.query(User).filter(User.email == email).first()
 
 
+def mark_email_verified(db: Session, *criteria) -> bool:
+    """Verify the unverified user matching criteria and clear its token in a single UPDATE."""
+    verified = db.query(User).filter(
+        *criteria,
+        User.is_email_verified.is_(False)
+    ).update(
+        {
+            User.is_email_verified: True,
+            User.email_verification_token: None,
+            User.updated_at: datetime.utcnow().isoformat()
+        },
+        synchronize_session=False
+    )
+    db.commit()
+    return bool(verified)
+
+
+def purge_expired_password_reset_tokens(db: Session) -> int:
+    """Clear every password reset token whose expiry has passed, returning the number cleared."""
+    # Expiries are stored as ISO-8601 UTC strings, which order lexicographically
+    purged = db.query(User).filter(
+        User.password_reset_expires < datetime.utcnow().isoformat()
+    ).update(
+        {
+            User.password_reset_token: None,
+            User.password_reset_expires: None
+        },
+        synchronize_session=False
+    )
+    db.commit()
+    return purged
+
+
+def send_verification_email_task(email: str, username: str, verification_token: str) -> None:
+    """Background task: send a verification email and surface delivery failures."""
+    if email_service.send_verification_email(email=email, username=username, verification_token=verification_token):
+        return
+    logger.error("Verification email to %s was not delivered; a resend is required", email)
+    # Let the user's next resend go out immediately instead of joining the failed one
+    verification_resend_cooldown.reset(email.lower())
+
+
 def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     """Get current authenticated user."""
     credentials_exception = HTTPException(
@@ -96,12 +205,8 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    try:
-        payload = jwt.decode(token, config.security.secret_key, algorithms=[config.security.algorithm])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-    except jwt.JWTError:
+    username = get_token_subject(token)
+    if username is None:
         raise credentials_exception
     
     user = db.query(User).filter(User.username == username).first()
@@ -113,12 +218,8 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
 
 def get_current_user_safe(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     """Get current authenticated user with safe error handling."""
-    try:
-        payload = jwt.decode(token, config.security.secret_key, algorithms=[config.security.algorithm])
-        username: str = payload.get("sub")
-        if username is None:
-            return None
-    except jwt.JWTError:
+    username = get_token_subject(token)
+    if username is None:
         return None
     
     user = db.query(User).filter(User.username == username).first()
@@ -141,25 +242,32 @@ def get_token_safe(request: Request) -> Optional[str]:
         return None
 
 
+def get_client_ip(request: Request) -> str:
+    """
+    Get the originating client IP.
+    
+    X-Forwarded-For is not read here: its leftmost entries are whatever the
+    client sent. Uvicorn's proxy-headers handling already resolves the client
+    address from the hops appended by proxies listed in FORWARDED_ALLOW_IPS.
+    """
+    return request.client.host if request.client else "unknown"
+
+
 def get_current_user_safe_v2(request: Request, db: Session = Depends(get_db)):
     """Get current authenticated user with safe error handling for missing tokens."""
     token = get_token_safe(request)
     if not token:
         return None
     
-    try:
-        payload = jwt.decode(token, config.security.secret_key, algorithms=[config.security.algorithm])
-        username: str = payload.get("sub")
-        if username is None:
-            return None
-    except jwt.JWTError:
+    username = get_token_subject(token)
+    if username is None:
         return None
     
     user = db.query(User).filter(User.username == username).first()
     return user
 
 
-def require_admin_role(current_user: User = Depends(get_current_user)):
+async def require_admin_role(current_user: User = Depends(get_current_user)):
     """Require admin or super_admin role."""
     if current_user.role not in ["admin", "super_admin"]:
         raise HTTPException(
@@ -169,7 +277,7 @@ def require_admin_role(current_user: User = Depends(get_current_user)):
     return current_user
 
 
-def require_super_admin_role(current_user: User = Depends(get_current_user)):
+async def require_super_admin_role(current_user: User = Depends(get_current_user)):
     """Require super_admin role."""
     if current_user.role != "super_admin":
         raise HTTPException(
@@ -179,58 +287,49 @@ def require_super_admin_role(current_user: User = Depends(get_current_user)):
     return current_user
 
 
-def require_user_role(current_user: User = Depends(get_current_user)):
+async def require_user_role(current_user: User = Depends(get_current_user)):
     """Require any authenticated user role."""
     return current_user
 
 
 @router.post("/register", response_model=StandardResponse, status_code=201)
-def register(user: UserCreate, db: Session = Depends(get_db)):
+def register(user: UserCreate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     """Register a new user."""
     with ResponseTimer() as timer:
         try:
             # Debug logging
-            logger.info(f"Registration attempt - Email: {user.email}, Username: {user.username}, First: {user.first_name}, Last: {user.last_name}, Role: {user.role}, Password length: {len(user.password) if user.password else 0}")
+            logger.info("Registration attempt - Email: %s, Username: %s, First: %s, Last: %s, Role: %s, Password length: %s", user.email, user.username, user.first_name, user.last_name, user.role, len(user.password) if user.password else 0)
             # Validate that we have either username or first_name+last_name
             if not user.username and not (user.first_name and user.last_name):
-                return create_error_response(
+                return timer.error_response(
                     message="Either username or both first_name and last_name are required",
-                    status_code=400,
-                    execution_time=timer.get_execution_time()
+                    status_code=400
                 )
             
             # Username and full_name are now generated in the schema's model_post_init method
             
             # Check if email already exists
             if get_user_by_email(db, user.email):
-                return create_error_response(
+                return timer.error_response(
                     message="Email already registered",
-                    status_code=400,
-                    execution_time=timer.get_execution_time()
+                    status_code=400
                 )
             
             # Validate role and convert to lowercase
             valid_roles = ["user", "admin", "super_admin"]
             user_role = user.role.lower() if user.role else "user"
             if user_role not in valid_roles:
-                return create_error_response(
+                return timer.error_response(
                     message=f"Invalid role. Must be one of: {valid_roles}",
-                    status_code=400,
-                    execution_time=timer.get_execution_time()
+                    status_code=400
                 )
             
             hashed_password = get_password_hash(user.password)
             
             # Generate email verification token
-            if email_service:
-                verification_token = email_service.generate_verification_token()
-            else:
-                # Fallback: generate a simple token if email service is not available
-                import secrets
-                import string
-                alphabet = string.ascii_letters + string.digits
-                verification_token = ''.join(secrets.choice(alphabet) for _ in range(32))
+            verification_token = secrets.token_urlsafe(32)
             
+            now = datetime.utcnow().isoformat()
             new_user = User(
                 username=user.username,
                 full_name=user.full_name,
@@ -240,130 +339,112 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
                 is_email_verified=True,  # Auto-verify users since email service is not configured
                 email_verification_token=verification_token,
                 role=user_role,
-                created_at=datetime.utcnow().isoformat(),
-                updated_at=datetime.utcnow().isoformat()
+                created_at=now,
+                updated_at=now
             )
             
             db.add(new_user)
             db.commit()
             db.refresh(new_user)
             
-            # Send verification email
-            email_sent = False
+            # Send verification email after the response, off the request path
             if email_service:
-                email_sent = email_service.send_verification_email(
+                background_tasks.add_task(
+                    send_verification_email_task,
                     email=user.email,
                     username=user.full_name,
                     verification_token=verification_token
                 )
             
-            user_data = UserResponse(
-                id=new_user.id,
-                username=new_user.username,
-                full_name=new_user.full_name,
-                email=new_user.email,
-                role=new_user.role,
-                is_active=new_user.is_active,
-                is_email_verified=new_user.is_email_verified,
-                created_at=new_user.created_at_str,
-                updated_at=new_user.updated_at_str
-            )
-            
-            # Prepare response message
-            if email_sent:
-                message = "User registered successfully. Please check your email to verify your account."
-            else:
-                message = "User registered successfully. Please contact support for email verification."
+            user_data = user_to_response(new_user)
             
-            return create_success_response(
+            return timer.success_response(
                 data=user_data,
-                status_code=201,
-                execution_time=timer.get_execution_time()
+                status_code=201
             )
             
         except Exception as e:
-            logger.error(f"Registration error: {str(e)}")
+            logger.error("Registration error: %s", e)
+            error_text = str(e).lower()
             # Sanitize error message for security
             error_message = "Registration failed"
-            if "duplicate key" in str(e).lower() or "unique constraint" in str(e).lower():
+            if "duplicate key" in error_text or "unique constraint" in error_text:
                 error_message = "Email or username already exists"
-            elif "email" in str(e).lower() and "validation" in str(e).lower():
+            elif "email" in error_text and "validation" in error_text:
                 error_message = "Invalid email format"
-            elif "password" in str(e).lower():
+            elif "password" in error_text:
                 error_message = "Password requirements not met"
-            elif "email_service" in str(e).lower() or "smtp" in str(e).lower():
+            elif "email_service" in error_text or "smtp" in error_text:
                 error_message = "Email service temporarily unavailable"
             
-            return create_error_response(
+            return timer.error_response(
                 message=error_message,
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
 @router.post("/login", response_model=StandardResponse)
-def login_for_access_token(login_data: LoginRequest, db: Session = Depends(get_db)):
+def login_for_access_token(login_data: LoginRequest, request: Request, response: Response, db: Session = Depends(get_db)):
     """Login with email and password."""
     with ResponseTimer() as timer:
         try:
+            # Throttle attempts per account and client. Checking and counting in one
+            # step keeps concurrent bursts within the budget; a successful login
+            # clears the count
+            rate_limit_key = (login_data.email.lower(), get_client_ip(request))
+            if not login_rate_limiter.try_acquire(rate_limit_key):
+                # Real 429 so clients and proxies can back off without parsing the body
+                response.status_code = 429
+                response.headers["Retry-After"] = str(login_rate_limiter.retry_after(rate_limit_key))
+                return timer.error_response(
+                    message="Too many failed login attempts. Please try again later.",
+                    status_code=429
+                )
+            
             # Find user by email
             user = get_user_by_email(db, login_data.email)
-            if not user:
-                return create_error_response(
+            
+            # Always run one bcrypt check, against a dummy hash when there is no
+            # stored password, so response time doesn't reveal whether the account exists
+            has_password = bool(user and user.hashed_password)
+            password_ok = verify_password(
+                login_data.password,
+                user.hashed_password if has_password else DUMMY_PASSWORD_HASH
+            )
+            
+            if not user or (has_password and not password_ok):
+                return timer.error_response(
                     message="Incorrect email or password",
-                    status_code=401,
-                    execution_time=timer.get_execution_time()
+                    status_code=401
                 )
             
-            # Verify password (skip for OAuth users who don't have passwords)
-            if user.hashed_password:
-                if not verify_password(login_data.password, user.hashed_password):
-                    return create_error_response(
-                        message="Incorrect email or password",
-                        status_code=401,
-                        execution_time=timer.get_execution_time()
-                    )
-            else:
+            if not has_password:
                 # User registered via OAuth, cannot login with password
-                return create_error_response(
+                return timer.error_response(
                     message="This account was created with Google. Please use Google Sign-In.",
-                    status_code=401,
-                    execution_time=timer.get_execution_time()
+                    status_code=401
                 )
             
             # Check if user is active
             if not user.is_active:
-                return create_error_response(
+                return timer.error_response(
                     message="Account is deactivated",
-                    status_code=401,
-                    execution_time=timer.get_execution_time()
+                    status_code=401
                 )
             
             # Email verification check removed
             # if not user.is_email_verified:
-            #     return create_error_response(
+            #     return timer.error_response(
             #         message="Please verify your email address before logging in",
-            #         status_code=401,
-            #         execution_time=timer.get_execution_time()
+            #         status_code=401
             #     )
             
-            access_token_expires = timedelta(minutes=config.security.access_token_expire_minutes)
-            access_token = create_access_token(
-                data={"sub": user.username, "role": user.role}, expires_delta=access_token_expires
-            )
+            login_rate_limiter.reset(rate_limit_key)
+            
+            access_token = create_access_token(data={"sub": user.username, "role": user.role})
             
             # Create user profile data
-            user_profile = UserResponse(
-                id=user.id,
-                username=user.username,
-                email=user.email,
-                full_name=user.full_name,
-                role=user.role,
-                is_active=user.is_active,
-                is_email_verified=user.is_email_verified,
-                created_at=user.created_at_str,
-                updated_at=user.updated_at_str
-            )
+            user_profile = user_to_response(user)
             
             # Create response data with token and profile
             response_data = {
@@ -372,25 +453,24 @@ def login_for_access_token(login_data: LoginRequest, db: Session = Depends(get_d
                 "user": user_profile
             }
             
-            return create_success_response(
+            return timer.success_response(
                 data=response_data,
-                status_code=200,
-                execution_time=timer.get_execution_time()
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Login error: {str(e)}")
+            logger.error("Login error: %s", e)
+            error_text = str(e).lower()
             # Sanitize error message for security
             error_message = "Login failed"
-            if "password" in str(e).lower():
+            if "password" in error_text:
                 error_message = "Authentication failed"
-            elif "email" in str(e).lower():
+            elif "email" in error_text:
                 error_message = "Authentication failed"
             
-            return create_error_response(
+            return timer.error_response(
                 message=error_message,
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -403,118 +483,132 @@ def verify_email(token: str, db: Session = Depends(get_db)):
     """
     with ResponseTimer() as timer:
         try:
-            # Find user by verification token
-            user = db.query(User).filter(User.email_verification_token == token).first()
-            if not user:
-                return create_error_response(
+            if not mark_email_verified(db, User.email_verification_token == token):
+                # Only look the token up again to pick the right error
+                if db.query(User.id).filter(User.email_verification_token == token).first():
+                    return timer.error_response(
+                        message="Email already verified",
+                        status_code=400
+                    )
+                return timer.error_response(
                     message="Invalid or expired verification token",
-                    status_code=400,
-                    execution_time=timer.get_execution_time()
-                )
-            
-            # Check if already verified
-            if user.is_email_verified:
-                return create_error_response(
-                    message="Email already verified",
-                    status_code=400,
-                    execution_time=timer.get_execution_time()
+                    status_code=400
                 )
             
-            # Verify email
-            user.is_email_verified = True
-            user.email_verification_token = None  # Clear the token
-            user.updated_at = datetime.utcnow().isoformat()
-            db.commit()
-            
-            return create_success_response(
+            return timer.success_response(
                 data={"message": "Email verified successfully"},
-                status_code=200,
-                execution_time=timer.get_execution_time()
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Email verification error: {str(e)}")
+            logger.error("Email verification error: %s", e)
+            error_text = str(e).lower()
             # Sanitize error message for security
             error_message = "Email verification failed"
-            if "database" in str(e).lower() or "connection" in str(e).lower():
+            if "database" in error_text or "connection" in error_text:
                 error_message = "Service temporarily unavailable"
-            elif "email" in str(e).lower():
+            elif "email" in error_text:
                 error_message = "Email verification failed"
             
-            return create_error_response(
+            return timer.error_response(
                 message=error_message,
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
 @router.post("/resend-verification", response_model=StandardResponse)
-def resend_verification_email(resend_data: ResendVerificationRequest, db: Session = Depends(get_db)):
+def resend_verification_email(
+    resend_data: ResendVerificationRequest,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """Resend email verification."""
+    cooldown_key = None
     with ResponseTimer() as timer:
         try:
             # Find user by email
             user = get_user_by_email(db, resend_data.email)
             if not user:
-                return create_error_response(
+                return timer.error_response(
                     message="Email not found",
-                    status_code=404,
-                    execution_time=timer.get_execution_time()
+                    status_code=404
                 )
             
             # Check if already verified
             if user.is_email_verified:
-                return create_error_response(
+                return timer.error_response(
                     message="Email already verified",
-                    status_code=400,
-                    execution_time=timer.get_execution_time()
+                    status_code=400
+                )
+            
+            rate_limit_key = user.email.lower()
+            
+            # Cap resends per address so the endpoint can't be used to flood a mailbox.
+            # Checked before the cooldown so an exhausted budget is reported on every
+            # retry rather than being coalesced into a send that never happens
+            if not verification_rate_limiter.is_allowed(rate_limit_key):
+                response.status_code = 429
+                response.headers["Retry-After"] = str(verification_rate_limiter.retry_after(rate_limit_key))
+                return timer.error_response(
+                    message="Too many verification emails requested. Please try again later.",
+                    status_code=429
+                )
+            
+            can_send = bool(email_service and email_service.is_configured)
+            message = (
+                "Verification email queued. It should arrive within a few minutes." if can_send
+                else "Failed to send verification email. Please contact support."
+            )
+            
+            # Coalesce repeat submits (double clicks, retries): a resend within the
+            # cooldown repeats the outcome of the send already under way instead of
+            # rotating the token, which would invalidate the link in that email
+            if not verification_resend_cooldown.try_acquire(rate_limit_key):
+                return timer.success_response(
+                    data={"message": message},
+                    status_code=200
                 )
+            cooldown_key = rate_limit_key
+            
+            # Every resend counts against the budget, whether or not the send succeeds
+            verification_rate_limiter.record(rate_limit_key)
             
             # Generate new verification token
-            if email_service:
-                verification_token = email_service.generate_verification_token()
-            else:
-                # Fallback: generate a simple token if email service is not available
-                import secrets
-                import string
-                alphabet = string.ascii_letters + string.digits
-                verification_token = ''.join(secrets.choice(alphabet) for _ in range(32))
+            verification_token = secrets.token_urlsafe(32)
             
             user.email_verification_token = verification_token
             user.updated_at = datetime.utcnow().isoformat()
             db.commit()
             
-            # Send verification email
-            email_sent = False
-            if email_service:
-                email_sent = email_service.send_verification_email(
+            # Send verification email after the response, off the request path
+            if can_send:
+                background_tasks.add_task(
+                    send_verification_email_task,
                     email=user.email,
                     username=user.full_name,
                     verification_token=verification_token
                 )
             
-            if email_sent:
-                message = "Verification email sent successfully"
-            else:
-                message = "Failed to send verification email. Please contact support."
-            
-            return create_success_response(
+            return timer.success_response(
                 data={"message": message},
-                status_code=200,
-                execution_time=timer.get_execution_time()
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Resend verification error: {str(e)}")
+            logger.error("Resend verification error: %s", e)
+            # Nothing was sent, so don't coalesce a retry into this failed attempt
+            if cooldown_key:
+                verification_resend_cooldown.reset(cooldown_key)
+            error_text = str(e).lower()
             # Sanitize error message for security
             error_message = "Failed to resend verification email"
-            if "database" in str(e).lower() or "connection" in str(e).lower():
+            if "database" in error_text or "connection" in error_text:
                 error_message = "Service temporarily unavailable"
             
-            return create_error_response(
+            return timer.error_response(
                 message=error_message,
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -523,41 +617,28 @@ def manual_verify_email(email: str, db: Session = Depends(get_db)):
     """Manually verify email for development/testing purposes."""
     with ResponseTimer() as timer:
         try:
-            # Find user by email
-            user = get_user_by_email(db, email)
-            if not user:
-                return create_error_response(
+            if not mark_email_verified(db, User.email == email):
+                # Only look the user up again to pick the right error
+                if db.query(User.id).filter(User.email == email).first():
+                    return timer.error_response(
+                        message="Email already verified",
+                        status_code=400
+                    )
+                return timer.error_response(
                     message="Email not found",
-                    status_code=404,
-                    execution_time=timer.get_execution_time()
-                )
-            
-            # Check if already verified
-            if user.is_email_verified:
-                return create_error_response(
-                    message="Email already verified",
-                    status_code=400,
-                    execution_time=timer.get_execution_time()
+                    status_code=404
                 )
             
-            # Manually verify email
-            user.is_email_verified = True
-            user.email_verification_token = None
-            user.updated_at = datetime.utcnow().isoformat()
-            db.commit()
-            
-            return create_success_response(
+            return timer.success_response(
                 data={"message": f"Email {email} manually verified for development"},
-                status_code=200,
-                execution_time=timer.get_execution_time()
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Manual verification error: {str(e)}")
-            return create_error_response(
+            logger.error("Manual verification error: %s", e)
+            return timer.error_response(
                 message="Manual verification failed",
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -572,17 +653,6 @@ def get_current_user_me(
     return get_user_profile(current_user=current_user)
 
 
-@router.get("/me", response_model=StandardResponse)
-def get_current_user_me(
-    current_user: User = Depends(get_current_user_safe_v2)
-):
-    """
-    Get current authenticated user profile.
-    Alias for /profile endpoint for compatibility.
-    """
-    return get_user_profile(current_user=current_user)
-
-
 @router.get("/profile", response_model=StandardResponse)
 def get_user_profile(
     current_user: User = Depends(get_current_user_safe_v2)
@@ -592,70 +662,46 @@ def get_user_profile(
         try:
             # Check if user is authenticated
             if not current_user:
-                return create_error_response(
+                return timer.error_response(
                     message="Authentication required",
-                    status_code=401,
-                    execution_time=timer.get_execution_time()
+                    status_code=401
                 )
             
             # Check if user is active
             if not current_user.is_active:
-                return create_error_response(
+                return timer.error_response(
                     message="Account is deactivated",
-                    status_code=403,
-                    execution_time=timer.get_execution_time()
-                )
-            
-            # Create user profile data with validation
-            try:
-                user_profile = UserResponse(
-                    id=current_user.id,
-                    username=current_user.username,
-                    email=current_user.email,
-                    full_name=current_user.full_name,
-                    role=current_user.role,
-                    is_active=current_user.is_active,
-                    is_email_verified=current_user.is_email_verified,
-                    created_at=current_user.created_at_str,
-                    updated_at=current_user.updated_at_str
-                )
-            except Exception as validation_error:
-                logger.error(f"Profile data validation error: {str(validation_error)}")
-                return create_error_response(
-                    message="Profile data validation failed",
-                    status_code=500,
-                    execution_time=timer.get_execution_time()
+                    status_code=403
                 )
             
-            return create_success_response(
-                data=user_profile,
-                status_code=200,
-                execution_time=timer.get_execution_time()
+            return timer.success_response(
+                data=user_to_response(current_user),
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Profile retrieval error: {str(e)}")
+            logger.error("Profile retrieval error: %s", e)
+            error_text = str(e).lower()
             # Sanitize error message for security
             error_message = "Failed to retrieve profile"
             status_code = 500
             
-            if "database" in str(e).lower() or "connection" in str(e).lower():
+            if "database" in error_text or "connection" in error_text:
                 error_message = "Service temporarily unavailable"
                 status_code = 503
-            elif "authentication" in str(e).lower() or "token" in str(e).lower():
+            elif "authentication" in error_text or "token" in error_text:
                 error_message = "Authentication failed"
                 status_code = 401
-            elif "permission" in str(e).lower() or "forbidden" in str(e).lower():
+            elif "permission" in error_text or "forbidden" in error_text:
                 error_message = "Access denied"
                 status_code = 403
-            elif "not found" in str(e).lower():
+            elif "not found" in error_text:
                 error_message = "User not found"
                 status_code = 404
             
-            return create_error_response(
+            return timer.error_response(
                 message=error_message,
-                status_code=status_code,
-                execution_time=timer.get_execution_time()
+                status_code=status_code
             )
 
 
@@ -670,44 +716,31 @@ def get_all_users(
     with ResponseTimer() as timer:
         try:
             if current_user.role not in ["admin", "super_admin"]:
-                return create_error_response(
+                return timer.error_response(
                     message="Admin access required",
-                    status_code=403,
-                    execution_time=timer.get_execution_time()
+                    status_code=403
                 )
             
-            users = db.query(User).offset(skip).limit(limit).all()
-            user_responses = [
-                UserResponse(
-                    id=user.id,
-                    username=user.username,
-                    full_name=user.full_name,
-                    email=user.email,
-                    role=user.role,
-                    is_active=user.is_active,
-                    is_email_verified=user.is_email_verified,
-                    created_at=user.created_at_str,
-                    updated_at=user.updated_at_str
-                ) for user in users
-            ]
-            
-            return create_success_response(
+            # Select plain column rows instead of hydrating full ORM objects
+            rows = db.query(*USER_RESPONSE_COLUMNS).offset(skip).limit(limit).all()
+            user_responses = [user_to_response(row) for row in rows]
+            
+            return timer.success_response(
                 data=user_responses,
-                status_code=200,
-                execution_time=timer.get_execution_time()
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Get users error: {str(e)}")
+            logger.error("Get users error: %s", e)
+            error_text = str(e).lower()
             # Sanitize error message for security
             error_message = "Failed to retrieve users"
-            if "database" in str(e).lower() or "connection" in str(e).lower():
+            if "database" in error_text or "connection" in error_text:
                 error_message = "Service temporarily unavailable"
             
-            return create_error_response(
+            return timer.error_response(
                 message=error_message,
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -722,28 +755,25 @@ def update_user(
     with ResponseTimer() as timer:
         try:
             if current_user.role not in ["admin", "super_admin"]:
-                return create_error_response(
+                return timer.error_response(
                     message="Admin access required",
-                    status_code=403,
-                    execution_time=timer.get_execution_time()
+                    status_code=403
                 )
             
             user = db.query(User).filter(User.id == user_id).first()
             if not user:
-                return create_error_response(
+                return timer.error_response(
                     message="User not found",
-                    status_code=404,
-                    execution_time=timer.get_execution_time()
+                    status_code=404
                 )
             
             # Validate role if provided and convert to lowercase
             if user_update.role:
                 user_update.role = user_update.role.lower()
                 if user_update.role not in ["user", "admin", "super_admin"]:
-                    return create_error_response(
+                    return timer.error_response(
                         message="Invalid role",
-                        status_code=400,
-                        execution_time=timer.get_execution_time()
+                        status_code=400
                     )
             
             # Update fields
@@ -755,42 +785,31 @@ def update_user(
             db.commit()
             db.refresh(user)
             
-            user_response = UserResponse(
-                id=user.id,
-                username=user.username,
-                full_name=user.full_name,
-                email=user.email,
-                role=user.role,
-                is_active=user.is_active,
-                is_email_verified=user.is_email_verified,
-                created_at=user.created_at_str,
-                updated_at=user.updated_at_str
-            )
+            user_response = user_to_response(user)
             
-            return create_success_response(
+            return timer.success_response(
                 data=user_response,
-                status_code=200,
-                execution_time=timer.get_execution_time()
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Update user error: {str(e)}")
+            logger.error("Update user error: %s", e)
+            error_text = str(e).lower()
             # Sanitize error message for security
             error_message = "Failed to update user"
-            if "database" in str(e).lower() or "connection" in str(e).lower():
+            if "database" in error_text or "connection" in error_text:
                 error_message = "Service temporarily unavailable"
-            elif "duplicate key" in str(e).lower() or "unique constraint" in str(e).lower():
+            elif "duplicate key" in error_text or "unique constraint" in error_text:
                 error_message = "User data conflict"
             
-            return create_error_response(
+            return timer.error_response(
                 message=error_message,
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
 @router.post("/forgot-password", response_model=StandardResponse)
-def forgot_password(forgot_data: ForgotPasswordRequest, db: Session = Depends(get_db)):
+def forgot_password(forgot_data: ForgotPasswordRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     """Request password reset email."""
     with ResponseTimer() as timer:
         try:
@@ -798,63 +817,48 @@ def forgot_password(forgot_data: ForgotPasswordRequest, db: Session = Depends(ge
             user = get_user_by_email(db, forgot_data.email)
             if not user:
                 # Don't reveal if email exists for security
-                return create_success_response(
+                return timer.success_response(
                     data={"message": "If the email exists, a password reset link has been sent."},
-                    status_code=200,
-                    execution_time=timer.get_execution_time()
+                    status_code=200
                 )
             
             # Check if user is active
             if not user.is_active:
-                return create_error_response(
+                return timer.error_response(
                     message="Account is deactivated",
-                    status_code=403,
-                    execution_time=timer.get_execution_time()
+                    status_code=403
                 )
             
             # Generate password reset token
-            if email_service:
-                reset_token = email_service.generate_verification_token()
-            else:
-                # Fallback: generate a simple token if email service is not available
-                import secrets
-                import string
-                alphabet = string.ascii_letters + string.digits
-                reset_token = ''.join(secrets.choice(alphabet) for _ in range(32))
+            reset_token = secrets.token_urlsafe(32)
             
             # Set token and expiration (1 hour from now)
             user.password_reset_token = reset_token
-            user.password_reset_expires = (datetime.utcnow() + timedelta(hours=1)).isoformat()
-            user.updated_at = datetime.utcnow().isoformat()
+            now = datetime.utcnow()
+            user.password_reset_expires = (now + timedelta(hours=1)).isoformat()
+            user.updated_at = now.isoformat()
             db.commit()
             
-            # Send password reset email
-            email_sent = False
+            # Send password reset email after the response, off the request path
             if email_service:
-                email_sent = email_service.send_password_reset_email(
+                background_tasks.add_task(
+                    email_service.send_password_reset_email,
                     email=user.email,
                     username=user.full_name or user.username,
                     reset_token=reset_token
                 )
             
-            if email_sent:
-                message = "If the email exists, a password reset link has been sent."
-            else:
-                message = "Password reset requested. Please contact support if you don't receive an email."
-            
             # Always return success message (don't reveal if email exists)
-            return create_success_response(
-                data={"message": message},
-                status_code=200,
-                execution_time=timer.get_execution_time()
+            return timer.success_response(
+                data={"message": "If the email exists, a password reset link has been sent."},
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Forgot password error: {str(e)}")
-            return create_error_response(
+            logger.error("Forgot password error: %s", e)
+            return timer.error_response(
                 message="Failed to process password reset request",
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -866,46 +870,44 @@ def reset_password(reset_data: ResetPasswordRequest, db: Session = Depends(get_d
             # Find user by reset token
             user = db.query(User).filter(User.password_reset_token == reset_data.token).first()
             if not user:
-                return create_error_response(
+                return timer.error_response(
                     message="Invalid or expired reset token",
-                    status_code=400,
-                    execution_time=timer.get_execution_time()
+                    status_code=400
                 )
             
+            now = datetime.utcnow()
+            
             # Check if token is expired
             if user.password_reset_expires:
                 try:
                     expires_at = datetime.fromisoformat(user.password_reset_expires.replace('Z', '+00:00'))
-                    if datetime.utcnow() > expires_at:
+                    if now > expires_at:
                         # Clear expired token
                         user.password_reset_token = None
                         user.password_reset_expires = None
-                        user.updated_at = datetime.utcnow().isoformat()
+                        user.updated_at = now.isoformat()
                         db.commit()
-                        return create_error_response(
+                        return timer.error_response(
                             message="Reset token has expired. Please request a new one.",
-                            status_code=400,
-                            execution_time=timer.get_execution_time()
+                            status_code=400
                         )
                 except (ValueError, AttributeError) as e:
-                    logger.warning(f"Error parsing expiration date: {e}")
+                    logger.warning("Error parsing expiration date: %s", e)
                     # If we can't parse the date, treat as expired for security
                     user.password_reset_token = None
                     user.password_reset_expires = None
-                    user.updated_at = datetime.utcnow().isoformat()
+                    user.updated_at = now.isoformat()
                     db.commit()
-                    return create_error_response(
+                    return timer.error_response(
                         message="Invalid reset token",
-                        status_code=400,
-                        execution_time=timer.get_execution_time()
+                        status_code=400
                     )
             
             # Check if user is active
             if not user.is_active:
-                return create_error_response(
+                return timer.error_response(
                     message="Account is deactivated",
-                    status_code=403,
-                    execution_time=timer.get_execution_time()
+                    status_code=403
                 )
             
             # Hash new password
@@ -915,21 +917,19 @@ def reset_password(reset_data: ResetPasswordRequest, db: Session = Depends(get_d
             user.hashed_password = hashed_password
             user.password_reset_token = None
             user.password_reset_expires = None
-            user.updated_at = datetime.utcnow().isoformat()
+            user.updated_at = now.isoformat()
             db.commit()
             
-            return create_success_response(
+            return timer.success_response(
                 data={"message": "Password reset successfully. You can now login with your new password."},
-                status_code=200,
-                execution_time=timer.get_execution_time()
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Reset password error: {str(e)}")
-            return create_error_response(
+            logger.error("Reset password error: %s", e)
+            return timer.error_response(
                 message="Failed to reset password",
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -942,10 +942,9 @@ def google_login():
     with ResponseTimer() as timer:
         try:
             if not config.security.google_client_id or not config.security.google_client_secret:
-                return create_error_response(
+                return timer.error_response(
                     message="Google OAuth is not configured",
-                    status_code=503,
-                    execution_time=timer.get_execution_time()
+                    status_code=503
                 )
             
             # Generate state token for CSRF protection
@@ -974,16 +973,15 @@ def google_login():
             return response
             
         except Exception as e:
-            logger.error(f"Google login initiation error: {str(e)}")
-            return create_error_response(
+            logger.error("Google login initiation error: %s", e)
+            return timer.error_response(
                 message="Failed to initiate Google login",
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
 @router.get("/google/callback")
-async def google_callback(
+def google_callback(
     code: Optional[str] = None,
     state: Optional[str] = None,
     error: Optional[str] = None,
@@ -997,7 +995,7 @@ async def google_callback(
     with ResponseTimer() as timer:
         try:
             if error:
-                logger.error(f"Google OAuth error: {error}")
+                logger.error("Google OAuth error: %s", error)
                 redirect_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:5173')}/auth/google/error?error={error}"
                 return RedirectResponse(url=redirect_url)
             
@@ -1007,19 +1005,17 @@ async def google_callback(
             
             # Verify state token (CSRF protection)
             cookie_state = request.cookies.get("oauth_state")
-            if not cookie_state or cookie_state != state:
+            if not cookie_state or not secrets.compare_digest(cookie_state.encode('utf-8'), state.encode('utf-8')):
                 logger.warning("OAuth state mismatch - possible CSRF attack")
                 redirect_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:5173')}/auth/google/error?error=invalid_state"
                 return RedirectResponse(url=redirect_url)
             
             # Exchange code for token
             try:
-                import httpx
-                
                 backend_url = os.getenv('BACKEND_URL', 'http://localhost:8050')
                 redirect_uri = config.security.google_redirect_uri or f"{backend_url}/api/v2/auth/google/callback"
                 
-                token_response = httpx.post(
+                token_response = google_http_client.post(
                     "https://oauth2.googleapis.com/token",
                     data={
                         "code": code,
@@ -1027,12 +1023,11 @@ async def google_callback(
                         "client_secret": config.security.google_client_secret,
                         "redirect_uri": redirect_uri,
                         "grant_type": "authorization_code",
-                    },
-                    timeout=10.0
+                    }
                 )
                 
                 if token_response.status_code != 200:
-                    logger.error(f"Token exchange failed: {token_response.text}")
+                    logger.error("Token exchange failed: %s", token_response.text)
                     redirect_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:5173')}/auth/google/error?error=token_exchange_failed"
                     return RedirectResponse(url=redirect_url)
                 
@@ -1045,14 +1040,13 @@ async def google_callback(
                     return RedirectResponse(url=redirect_url)
                 
                 # Get user info from Google
-                userinfo_response = httpx.get(
+                userinfo_response = google_http_client.get(
                     "https://www.googleapis.com/oauth2/v2/userinfo",
-                    headers={"Authorization": f"Bearer {token_data.get('access_token')}"},
-                    timeout=10.0
+                    headers={"Authorization": f"Bearer {token_data.get('access_token')}"}
                 )
                 
                 if userinfo_response.status_code != 200:
-                    logger.error(f"User info fetch failed: {userinfo_response.text}")
+                    logger.error("User info fetch failed: %s", userinfo_response.text)
                     redirect_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:5173')}/auth/google/error?error=userinfo_failed"
                     return RedirectResponse(url=redirect_url)
                 
@@ -1069,12 +1063,15 @@ async def google_callback(
                     redirect_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:5173')}/auth/google/error?error=missing_user_data"
                     return RedirectResponse(url=redirect_url)
                 
-                # Check if user exists by Google ID
-                user = db.query(User).filter(User.google_id == google_id).first()
+                # Look up by Google ID and email in one round-trip; a Google ID match wins
+                candidates = db.query(User).filter(
+                    or_(User.google_id == google_id, User.email == email)
+                ).all()
+                user = next((u for u in candidates if u.google_id == google_id), None)
                 
                 if not user:
                     # Check if user exists by email (link accounts)
-                    user = db.query(User).filter(User.email == email).first()
+                    user = next((u for u in candidates if u.email == email), None)
                     
                     if user:
                         # Link Google account to existing user
@@ -1085,17 +1082,24 @@ async def google_callback(
                         user.updated_at = datetime.utcnow().isoformat()
                         db.commit()
                         db.refresh(user)
-                        logger.info(f"Linked Google account to existing user {user.id}")
+                        logger.info("Linked Google account to existing user %s", user.id)
                     else:
                         # Create new user
                         # Generate username from email
                         username_base = email.split("@")[0]
+                        # Fetch every taken username with this prefix once instead of probing per suffix
+                        taken_usernames = {
+                            row.username for row in db.query(User.username).filter(
+                                User.username.startswith(username_base, autoescape=True)
+                            )
+                        }
                         username = username_base
                         counter = 1
-                        while db.query(User).filter(User.username == username).first():
+                        while username in taken_usernames:
                             username = f"{username_base}{counter}"
                             counter += 1
                         
+                        now = datetime.utcnow().isoformat()
                         new_user = User(
                             username=username,
                             full_name=name or f"{given_name} {family_name}".strip() or username,
@@ -1105,15 +1109,15 @@ async def google_callback(
                             is_active=True,
                             is_email_verified=True,  # Google emails are verified
                             role="user",
-                            created_at=datetime.utcnow().isoformat(),
-                            updated_at=datetime.utcnow().isoformat()
+                            created_at=now,
+                            updated_at=now
                         )
                         
                         db.add(new_user)
                         db.commit()
                         db.refresh(new_user)
                         user = new_user
-                        logger.info(f"Created new user from Google OAuth: {user.id}")
+                        logger.info("Created new user from Google OAuth: %s", user.id)
                 
                 # Check if user is active
                 if not user.is_active:
@@ -1121,11 +1125,7 @@ async def google_callback(
                     return RedirectResponse(url=redirect_url)
                 
                 # Create JWT token
-                access_token_expires = timedelta(minutes=config.security.access_token_expire_minutes)
-                jwt_token = create_access_token(
-                    data={"sub": user.username, "role": user.role},
-                    expires_delta=access_token_expires
-                )
+                jwt_token = create_access_token(data={"sub": user.username, "role": user.role})
                 
                 # Redirect to frontend with token
                 # Try to get frontend URL from environment, with fallbacks
@@ -1136,7 +1136,7 @@ async def google_callback(
                 # Ensure no trailing slash
                 frontend_url = frontend_url.rstrip('/')
                 redirect_url = f"{frontend_url}/auth/google/success?token={jwt_token}"
-                logger.info(f"OAuth success - Redirecting to frontend: {redirect_url}")
+                logger.info("OAuth success - Redirecting to frontend: %s", redirect_url)
                 
                 response = RedirectResponse(url=redirect_url)
                 response.delete_cookie(key="oauth_state")
@@ -1144,11 +1144,11 @@ async def google_callback(
                 return response
                 
             except Exception as e:
-                logger.error(f"Error processing Google OAuth callback: {str(e)}")
+                logger.error("Error processing Google OAuth callback: %s", e)
                 redirect_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:5173')}/auth/google/error?error=processing_failed"
                 return RedirectResponse(url=redirect_url)
             
         except Exception as e:
-            logger.error(f"Google callback error: {str(e)}")
+            logger.error("Google callback error: %s", e)
             redirect_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:5173')}/auth/google/error?error=callback_failed"
             return RedirectResponse(url=redirect_url)
@@ -7,10 +7,11 @@ This module provides endpoints for managing diagnosis chat sessions and messages
 import logging
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from healthnavi.core.database import get_db
-from healthnavi.core.response_utils import create_success_response, create_error_response, ResponseTimer
+from healthnavi.core.response_utils import ResponseTimer
 from healthnavi.models.user import User
 from healthnavi.schemas import (
     ChatSessionCreate, ChatSessionUpdate, ChatSessionResponse, 
@@ -21,7 +22,7 @@ from healthnavi.services.diagnosis_session_service import DiagnosisSessionServic
 from healthnavi.api.v1.auth import require_user_role
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post("/sessions", response_model=StandardResponse, status_code=201)
@@ -36,19 +37,17 @@ async def create_chat_session(
             service = DiagnosisSessionService(db)
             session = service.create_session(current_user, session_data)
             
-            return create_success_response(
+            return timer.success_response(
                 data=session,
                 status_code=201,
-                message="Chat session created successfully",
-                execution_time=timer.get_execution_time()
+                message="Chat session created successfully"
             )
             
         except Exception as e:
-            logger.error(f"Error creating chat session: {e}")
-            return create_error_response(
+            logger.error("Error creating chat session: %s", e)
+            return timer.error_response(
                 message="Failed to create chat session",
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -65,18 +64,16 @@ async def list_chat_sessions(
             service = DiagnosisSessionService(db)
             sessions = service.list_sessions(current_user, page, per_page)
             
-            return create_success_response(
+            return timer.success_response(
                 data=sessions,
-                status_code=200,
-                execution_time=timer.get_execution_time()
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Error listing chat sessions: {e}")
-            return create_error_response(
+            logger.error("Error listing chat sessions: %s", e)
+            return timer.error_response(
                 message="Failed to list chat sessions",
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -93,24 +90,21 @@ async def get_chat_session(
             session = service.get_session(session_id, current_user)
             
             if not session:
-                return create_error_response(
+                return timer.error_response(
                     message="Chat session not found",
-                    status_code=404,
-                    execution_time=timer.get_execution_time()
+                    status_code=404
                 )
             
-            return create_success_response(
+            return timer.success_response(
                 data=session,
-                status_code=200,
-                execution_time=timer.get_execution_time()
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Error getting chat session {session_id}: {e}")
-            return create_error_response(
+            logger.error("Error getting chat session %s: %s", session_id, e)
+            return timer.error_response(
                 message="Failed to get chat session",
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -127,24 +121,21 @@ async def get_chat_session_with_messages(
             session = service.get_session_with_messages(session_id, current_user)
             
             if not session:
-                return create_error_response(
+                return timer.error_response(
                     message="Chat session not found",
-                    status_code=404,
-                    execution_time=timer.get_execution_time()
+                    status_code=404
                 )
             
-            return create_success_response(
+            return timer.success_response(
                 data=session,
-                status_code=200,
-                execution_time=timer.get_execution_time()
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Error getting chat session with messages {session_id}: {e}")
-            return create_error_response(
+            logger.error("Error getting chat session with messages %s: %s", session_id, e)
+            return timer.error_response(
                 message="Failed to get chat session with messages",
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -162,25 +153,22 @@ async def update_chat_session(
             session = service.update_session(session_id, current_user, update_data)
             
             if not session:
-                return create_error_response(
+                return timer.error_response(
                     message="Chat session not found",
-                    status_code=404,
-                    execution_time=timer.get_execution_time()
+                    status_code=404
                 )
             
-            return create_success_response(
+            return timer.success_response(
                 data=session,
                 status_code=200,
-                message="Chat session updated successfully",
-                execution_time=timer.get_execution_time()
+                message="Chat session updated successfully"
             )
             
         except Exception as e:
-            logger.error(f"Error updating chat session {session_id}: {e}")
-            return create_error_response(
+            logger.error("Error updating chat session %s: %s", session_id, e)
+            return timer.error_response(
                 message="Failed to update chat session",
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -197,25 +185,22 @@ async def delete_chat_session(
             deleted = service.delete_session(session_id, current_user)
             
             if not deleted:
-                return create_error_response(
+                return timer.error_response(
                     message="Chat session not found",
-                    status_code=404,
-                    execution_time=timer.get_execution_time()
+                    status_code=404
                 )
             
-            return create_success_response(
+            return timer.success_response(
                 data={"deleted": True},
                 status_code=200,
-                message="Chat session deleted successfully",
-                execution_time=timer.get_execution_time()
+                message="Chat session deleted successfully"
             )
             
         except Exception as e:
-            logger.error(f"Error deleting chat session {session_id}: {e}")
-            return create_error_response(
+            logger.error("Error deleting chat session %s: %s", session_id, e)
+            return timer.error_response(
                 message="Failed to delete chat session",
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -233,25 +218,22 @@ async def add_message_to_session(
             message = service.add_message(session_id, current_user, message_data)
             
             if not message:
-                return create_error_response(
+                return timer.error_response(
                     message="Chat session not found",
-                    status_code=404,
-                    execution_time=timer.get_execution_time()
+                    status_code=404
                 )
             
-            return create_success_response(
+            return timer.success_response(
                 data=message,
                 status_code=201,
-                message="Message added successfully",
-                execution_time=timer.get_execution_time()
+                message="Message added successfully"
             )
             
         except Exception as e:
-            logger.error(f"Error adding message to session {session_id}: {e}")
-            return create_error_response(
+            logger.error("Error adding message to session %s: %s", session_id, e)
+            return timer.error_response(
                 message="Failed to add message",
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -267,18 +249,16 @@ async def get_chat_history(
             service = DiagnosisSessionService(db)
             chat_history = service.get_chat_history(session_id, current_user)
             
-            return create_success_response(
+            return timer.success_response(
                 data={"chat_history": chat_history},
-                status_code=200,
-                execution_time=timer.get_execution_time()
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Error getting chat history for session {session_id}: {e}")
-            return create_error_response(
+            logger.error("Error getting chat history for session %s: %s", session_id, e)
+            return timer.error_response(
                 message="Failed to get chat history",
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -2,20 +2,77 @@
 Diagnosis router for HealthNavi AI CDSS.
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session, joinedload
+from healthnavi.core.constants import MODEL_NAME
 from healthnavi.core.database import get_db
-from healthnavi.core.response_utils import create_success_response, create_error_response, ResponseTimer
+from healthnavi.core.rate_limiter import diagnosis_rate_limiter
+from healthnavi.core.response_utils import ResponseTimer
 from healthnavi.models.user import User
 from healthnavi.schemas import DiagnosisInput, DiagnosisResponse, StandardResponse, SuccessResponse, ChatMessageCreate, MessageFeedbackRequest, MessageFeedbackResponse
+from healthnavi.services import vectorstore_manager
 from healthnavi.services.conversational_service import generate_response
+from healthnavi.services.genai_client import get_genai_client
 from healthnavi.services.diagnosis_session_service import DiagnosisSessionService
-from healthnavi.api.v1.auth import get_current_user, require_user_role, require_admin_role, get_current_user_safe_v2
+from healthnavi.api.v1.auth import get_current_user, require_user_role, require_admin_role, get_current_user_safe_v2, get_client_ip
 from healthnavi.models.diagnosis_session import ChatMessage, MessageFeedback
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+# Seconds a health probe result is reused, so frequent polling by load
+# balancers does not hit the model and vector store backends each time
+HEALTH_CHECK_TTL_SECONDS = 10
+_health_snapshot = {"checked_at": None, "error": None}
+# Serializes probes so polls arriving mid-probe wait for its result
+_health_lock = asyncio.Lock()
+
+
+def _health_snapshot_fresh() -> bool:
+    """Whether the last probe result is still within its TTL."""
+    checked_at = _health_snapshot["checked_at"]
+    return checked_at is not None and time.monotonic() - checked_at < HEALTH_CHECK_TTL_SECONDS
+
+
+def probe_ai_backends() -> Optional[str]:
+    """Check the vector store and model backends directly. Returns an error message, or None when healthy."""
+    if not vectorstore_manager.vectorstore_initialized or not vectorstore_manager.vectordb_service.check_collection_exists():
+        return "Knowledge base temporarily unavailable"
+    
+    # Model metadata lookup: verifies credentials and reachability without generating
+    get_genai_client().models.get(model=MODEL_NAME)
+    return None
+
+
+async def check_ai_service() -> Optional[str]:
+    """Probe the AI service, reusing a recent result. Returns an error message, or None when healthy."""
+    if _health_snapshot_fresh():
+        return _health_snapshot["error"]
+    
+    async with _health_lock:
+        # Another poll may have refreshed the result while this one waited
+        if _health_snapshot_fresh():
+            return _health_snapshot["error"]
+        
+        try:
+            error = await asyncio.to_thread(probe_ai_backends)
+        except Exception as e:
+            logger.error("Diagnosis health check failed: %s", e)
+            # Sanitize error message for security
+            error_text = str(e).lower()
+            if "database" in error_text or "connection" in error_text:
+                error = "Service temporarily unavailable"
+            else:
+                error = "AI service temporarily unavailable"
+        
+        _health_snapshot.update(checked_at=time.monotonic(), error=error)
+        return error
 
 
 @router.get("/health", response_model=StandardResponse)
@@ -25,49 +82,38 @@ async def diagnosis_health():
     Checks if the AI service is available and responding.
     """
     with ResponseTimer() as timer:
-        try:
-            # Test AI service with a simple query
-            test_response, _, _ = await generate_response(
-                query="test",
-                chat_history="",
-                patient_data="test patient data"
-            )
-            
-            if test_response and len(test_response.strip()) > 0:
-                health_data = {
-                    "status": "healthy",
-                    "ai_service": "available",
-                    "message": "Diagnosis service is operational"
-                }
-                
-                return create_success_response(
-                    data=health_data,
-                    status_code=200,
-                    message="Diagnosis service is healthy",
-                    execution_time=timer.get_execution_time()
-                )
-            else:
-                return create_error_response(
-                    message="AI service returned empty response",
-                    status_code=503,
-                    execution_time=timer.get_execution_time()
-                )
-                
-        except Exception as e:
-            logger.error(f"Diagnosis health check failed: {str(e)}")
-            # Sanitize error message for security
-            error_message = "AI service temporarily unavailable"
-            if "database" in str(e).lower() or "connection" in str(e).lower():
-                error_message = "Service temporarily unavailable"
-            
-            return create_error_response(
-                message=error_message,
-                status_code=503,
-                execution_time=timer.get_execution_time()
+        error = await check_ai_service()
+        if error:
+            return timer.error_response(
+                message=error,
+                status_code=503
             )
-
-
-@router.post("/diagnose", response_model=StandardResponse)
+        
+        health_data = {
+            "status": "healthy",
+            "ai_service": "available",
+            "message": "Diagnosis service is operational"
+        }
+        
+        return timer.success_response(
+            data=health_data,
+            status_code=200,
+            message="Diagnosis service is healthy"
+        )
+
+
+async def enforce_diagnosis_rate_limit(request: Request, current_user: User = Depends(get_current_user_safe_v2)):
+    """Throttle diagnosis requests per user, or per client IP for anonymous callers."""
+    key = ("user", current_user.id) if current_user else ("ip", get_client_ip(request))
+    if not diagnosis_rate_limiter.try_acquire(key):
+        raise HTTPException(
+            status_code=429,
+            detail="Too many diagnosis requests. Please try again later.",
+            headers={"Retry-After": str(diagnosis_rate_limiter.retry_after(key))}
+        )
+
+
+@router.post("/diagnose", response_model=StandardResponse, dependencies=[Depends(enforce_diagnosis_rate_limit)])
 async def diagnose(data: DiagnosisInput, current_user: User = Depends(get_current_user_safe_v2), db: Session = Depends(get_db)):
     """
     Generate AI-powered diagnosis based on patient data.
@@ -77,16 +123,17 @@ async def diagnose(data: DiagnosisInput, current_user: User = Depends(get_curren
         try:
             # Validate input data
             if not data.patient_data or len(data.patient_data.strip()) < 3:
-                return create_error_response(
+                return timer.error_response(
                     message="Patient data must be at least 3 characters long",
-                    status_code=400,
-                    execution_time=timer.get_execution_time()
+                    status_code=400
                 )
 
             # Handle both authenticated and unauthenticated users
-            user_info = f"{current_user.username} (role: {current_user.role})" if current_user else "unauthenticated user"
-            logger.info(f"Diagnosis request from: {user_info}")
-            logger.info(f"Patient data length: {len(data.patient_data)} characters")
+            if current_user:
+                logger.info("Diagnosis request from: %s (role: %s)", current_user.username, current_user.role)
+            else:
+                logger.info("Diagnosis request from: unauthenticated user")
+            logger.info("Patient data length: %s characters", len(data.patient_data))
 
             # Get chat history from session if session_id is provided
             chat_history = data.chat_history or ""
@@ -100,7 +147,7 @@ async def diagnose(data: DiagnosisInput, current_user: User = Depends(get_curren
                 try:
                     chat_history = session_service.get_chat_history(session_id, current_user)
                 except Exception as e:
-                    logger.warning(f"Could not get chat history from session {session_id}: {e}")
+                    logger.warning("Could not get chat history from session %s: %s", session_id, e)
                     # Continue with provided chat_history
             else:
                 # Auto-create a new session if none provided and user is authenticated
@@ -113,9 +160,9 @@ async def diagnose(data: DiagnosisInput, current_user: User = Depends(get_curren
                         )
                         new_session = session_service.create_session(current_user, new_session_data)
                         session_id = new_session.id
-                        logger.info(f"Auto-created new diagnosis session {session_id} for user {current_user.id}")
+                        logger.info("Auto-created new diagnosis session %s for user %s", session_id, current_user.id)
                     except Exception as e:
-                        logger.warning(f"Could not auto-create session: {e}")
+                        logger.warning("Could not auto-create session: %s", e)
                         # Continue without session
                 else:
                     # For unauthenticated users, use the provided session_id or None
@@ -124,7 +171,7 @@ async def diagnose(data: DiagnosisInput, current_user: User = Depends(get_curren
             # Use the real AI service to generate response
             # Explicitly default to False if not provided or None
             deep_search_enabled = data.deep_search if data.deep_search is not None else False
-            logger.info(f"Search mode: {'DEEP SEARCH' if deep_search_enabled else 'QUICK SEARCH'}")
+            logger.info("Search mode: %s", 'DEEP SEARCH' if deep_search_enabled else 'QUICK SEARCH')
             
             try:
                 response, diagnosis_complete, prompt_type, followup_questions = await generate_response(
@@ -133,24 +180,22 @@ async def diagnose(data: DiagnosisInput, current_user: User = Depends(get_curren
                     patient_data=data.patient_data,
                     deep_search=deep_search_enabled
                 )
-                logger.info(f"Prompt type used: {prompt_type}")
+                logger.info("Prompt type used: %s", prompt_type)
                 # Ensure followup_questions is always a list
                 if followup_questions is None:
                     followup_questions = []
                 # Validate AI response
                 if not response or len(response.strip()) < 10:
-                    return create_error_response(
+                    return timer.error_response(
                         message="AI service returned insufficient response. Please try again.",
-                        status_code=503,
-                        execution_time=timer.get_execution_time()
+                        status_code=503
                     )
                     
             except Exception as ai_error:
-                logger.error(f"AI service error: {str(ai_error)}")
-                return create_error_response(
-                    message=f"AI service is currently unavailable. Error: {str(ai_error)}",
-                    status_code=503,
-                    execution_time=timer.get_execution_time()
+                logger.error("AI service error: %s", ai_error)
+                return timer.error_response(
+                    message="AI service is currently unavailable. Please try again later.",
+                    status_code=503
                 )
 
             # Store messages in session only for authenticated users
@@ -175,10 +220,10 @@ async def diagnose(data: DiagnosisInput, current_user: User = Depends(get_curren
                     ai_msg_response = session_service.add_message(session_id, current_user, ai_message)
                     message_id = ai_msg_response.id if ai_msg_response else None
                     
-                    logger.info(f"Stored messages in session {session_id}, message_id: {message_id}")
+                    logger.info("Stored messages in session %s, message_id: %s", session_id, message_id)
                     
                 except Exception as e:
-                    logger.warning(f"Could not store messages in session {session_id}: {e}")
+                    logger.warning("Could not store messages in session %s: %s", session_id, e)
                     # Continue without storing
             else:
                 logger.info("Skipping message storage for unauthenticated user")
@@ -190,53 +235,40 @@ async def diagnose(data: DiagnosisInput, current_user: User = Depends(get_curren
                 f"Doctor: {data.patient_data}\nAI Assistant: {response}"
             )
 
-            logger.info(f"AI diagnosis completed successfully. Response length: {len(response)} characters")
+            logger.info("AI diagnosis completed successfully. Response length: %s characters", len(response))
             
             if followup_questions is None:
                 followup_questions = []
             
-            try:
-                diagnosis_data = DiagnosisResponse(
-                    model_response=response,
-                    diagnosis_complete=diagnosis_complete,
-                    updated_chat_history=updated_chat_history,
-                    session_id=session_id,
-                    message_id=message_id,
-                    prompt_type=prompt_type,
-                    followup_questions=followup_questions
-                )
-            except Exception as schema_error:
-                logger.error(f"Error creating DiagnosisResponse schema: {schema_error}", exc_info=True)
-                # Return with empty followup_questions as fallback
-                diagnosis_data = DiagnosisResponse(
-                    model_response=response,
-                    diagnosis_complete=diagnosis_complete,
-                    updated_chat_history=updated_chat_history,
-                    session_id=session_id,
-                    message_id=message_id,
-                    prompt_type=prompt_type,
-                    followup_questions=[]
-                )
+            # Every field comes from the model call or the database, so skip re-validation
+            diagnosis_data = DiagnosisResponse.model_construct(
+                model_response=response,
+                diagnosis_complete=diagnosis_complete,
+                updated_chat_history=updated_chat_history,
+                session_id=session_id,
+                message_id=message_id,
+                prompt_type=prompt_type,
+                followup_questions=followup_questions
+            )
             
-            return create_success_response(
+            return timer.success_response(
                 data=diagnosis_data,
-                status_code=200,
-                execution_time=timer.get_execution_time()
+                status_code=200
             )
             
         except Exception as e:
-            logger.error(f"Unexpected error in diagnose endpoint: {str(e)}")
+            logger.error("Unexpected error in diagnose endpoint: %s", e)
             # Sanitize error message for security
             error_message = "Diagnosis generation failed"
-            if "database" in str(e).lower() or "connection" in str(e).lower():
+            error_text = str(e).lower()
+            if "database" in error_text or "connection" in error_text:
                 error_message = "Service temporarily unavailable"
-            elif "ai" in str(e).lower() or "model" in str(e).lower():
+            elif "ai" in error_text or "model" in error_text:
                 error_message = "AI service temporarily unavailable"
             
-            return create_error_response(
+            return timer.error_response(
                 message=error_message,
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -252,14 +284,6 @@ async def submit_feedback(
     """
     with ResponseTimer() as timer:
         try:
-            # Validate feedback type
-            if feedback_data.feedback_type not in ['helpful', 'not_helpful']:
-                return create_error_response(
-                    message="Invalid feedback type. Must be 'helpful' or 'not_helpful'",
-                    status_code=400,
-                    execution_time=timer.get_execution_time()
-                )
-
             # Verify message exists and belongs to the user
             message = db.query(ChatMessage).options(
                 joinedload(ChatMessage.session)
@@ -269,18 +293,16 @@ async def submit_feedback(
             ).first()
 
             if not message:
-                return create_error_response(
+                return timer.error_response(
                     message="Message not found or feedback not allowed on this message type",
-                    status_code=404,
-                    execution_time=timer.get_execution_time()
+                    status_code=404
                 )
 
             # Verify the message belongs to a session owned by the user
             if message.session.user_id != current_user.id:
-                return create_error_response(
+                return timer.error_response(
                     message="You can only provide feedback on your own messages",
-                    status_code=403,
-                    execution_time=timer.get_execution_time()
+                    status_code=403
                 )
 
             # Check if feedback already exists for this message
@@ -295,7 +317,7 @@ async def submit_feedback(
                 db.commit()
                 db.refresh(existing_feedback)
 
-                logger.info(f"Updated feedback {existing_feedback.id} for message {feedback_data.message_id} by user {current_user.id}")
+                logger.info("Updated feedback %s for message %s by user %s", existing_feedback.id, feedback_data.message_id, current_user.id)
 
                 feedback_response = MessageFeedbackResponse(
                     id=existing_feedback.id,
@@ -306,27 +328,27 @@ async def submit_feedback(
                     updated_at=existing_feedback.updated_at
                 )
 
-                return create_success_response(
+                return timer.success_response(
                     data=feedback_response,
                     status_code=200,
-                    message="Feedback updated successfully",
-                    execution_time=timer.get_execution_time()
+                    message="Feedback updated successfully"
                 )
             else:
                 # Create new feedback
+                now = datetime.utcnow().isoformat()
                 new_feedback = MessageFeedback(
                     message_id=feedback_data.message_id,
                     user_id=current_user.id,
                     feedback_type=feedback_data.feedback_type,
-                    created_at=datetime.utcnow().isoformat(),
-                    updated_at=datetime.utcnow().isoformat()
+                    created_at=now,
+                    updated_at=now
                 )
 
                 db.add(new_feedback)
                 db.commit()
                 db.refresh(new_feedback)
 
-                logger.info(f"Created feedback {new_feedback.id} for message {feedback_data.message_id} by user {current_user.id}")
+                logger.info("Created feedback %s for message %s by user %s", new_feedback.id, feedback_data.message_id, current_user.id)
 
                 feedback_response = MessageFeedbackResponse(
                     id=new_feedback.id,
@@ -337,24 +359,23 @@ async def submit_feedback(
                     updated_at=new_feedback.updated_at
                 )
 
-                return create_success_response(
+                return timer.success_response(
                     data=feedback_response,
                     status_code=201,
-                    message="Feedback submitted successfully",
-                    execution_time=timer.get_execution_time()
+                    message="Feedback submitted successfully"
                 )
 
         except Exception as e:
-            logger.error(f"Error submitting feedback: {str(e)}")
+            logger.error("Error submitting feedback: %s", e)
             db.rollback()
             error_message = "Failed to submit feedback"
-            if "database" in str(e).lower() or "connection" in str(e).lower():
+            error_text = str(e).lower()
+            if "database" in error_text or "connection" in error_text:
                 error_message = "Service temporarily unavailable"
 
-            return create_error_response(
+            return timer.error_response(
                 message=error_message,
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
 
 
@@ -376,33 +397,31 @@ async def remove_feedback(
             ).first()
 
             if not feedback:
-                return create_error_response(
+                return timer.error_response(
                     message="Feedback not found",
-                    status_code=404,
-                    execution_time=timer.get_execution_time()
+                    status_code=404
                 )
 
             db.delete(feedback)
             db.commit()
 
-            logger.info(f"Removed feedback for message {message_id} by user {current_user.id}")
+            logger.info("Removed feedback for message %s by user %s", message_id, current_user.id)
 
-            return create_success_response(
+            return timer.success_response(
                 data={"message_id": message_id},
                 status_code=200,
-                message="Feedback removed successfully",
-                execution_time=timer.get_execution_time()
+                message="Feedback removed successfully"
             )
 
         except Exception as e:
-            logger.error(f"Error removing feedback: {str(e)}")
+            logger.error("Error removing feedback: %s", e)
             db.rollback()
             error_message = "Failed to remove feedback"
-            if "database" in str(e).lower() or "connection" in str(e).lower():
+            error_text = str(e).lower()
+            if "database" in error_text or "connection" in error_text:
                 error_message = "Service temporarily unavailable"
 
-            return create_error_response(
+            return timer.error_response(
                 message=error_message,
-                status_code=500,
-                execution_time=timer.get_execution_time()
+                status_code=500
             )
@@ -92,14 +92,14 @@ class AIConfigManager:
             
             self.config_dir = None
             for path in possible_paths:
-                logger.info(f"Checking path: {path}")
-                logger.info(f"Path exists: {path.exists()}")
+                logger.info("Checking path: %s", path)
+                logger.info("Path exists: %s", path.exists())
                 if path.exists():
                     prompts_dir = path / "prompts"
-                    logger.info(f"Prompts dir exists: {prompts_dir.exists()}")
+                    logger.info("Prompts dir exists: %s", prompts_dir.exists())
                     if prompts_dir.exists():
                         self.config_dir = path
-                        logger.info(f"Found config directory at: {self.config_dir}")
+                        logger.info("Found config directory at: %s", self.config_dir)
                         break
             
             if self.config_dir is None:
@@ -133,7 +133,7 @@ class AIConfigManager:
             logger.info("AI configuration loaded successfully")
             
         except Exception as e:
-            logger.error(f"Failed to load AI configuration: {e}")
+            logger.error("Failed to load AI configuration: %s", e)
             # Fallback to default configuration
             self._config = self._get_default_config()
     
@@ -142,7 +142,7 @@ class AIConfigManager:
         models_file = self.config_dir / "model_profiles.json"
         
         if not models_file.exists():
-            logger.warning(f"Model profiles file not found: {models_file}")
+            logger.warning("Model profiles file not found: %s", models_file)
             return self._get_default_models()
         
         try:
@@ -165,7 +165,7 @@ class AIConfigManager:
             return models
             
         except Exception as e:
-            logger.error(f"Failed to load model profiles: {e}")
+            logger.error("Failed to load model profiles: %s", e)
             return self._get_default_models()
     
     def _load_prompts(self) -> Dict[QueryType, PromptConfig]:
@@ -173,12 +173,12 @@ class AIConfigManager:
         prompts_dir = self.config_dir / "prompts"
         prompts = {}
         
-        logger.info(f"Loading prompts from: {prompts_dir}")
-        logger.info(f"Config dir exists: {self.config_dir.exists()}")
-        logger.info(f"Prompts dir exists: {prompts_dir.exists()}")
+        logger.info("Loading prompts from: %s", prompts_dir)
+        logger.info("Config dir exists: %s", self.config_dir.exists())
+        logger.info("Prompts dir exists: %s", prompts_dir.exists())
         
         if not prompts_dir.exists():
-            logger.warning(f"Prompts directory not found: {prompts_dir}")
+            logger.warning("Prompts directory not found: %s", prompts_dir)
             return self._get_default_prompts()
         
         # Load each prompt file
@@ -191,18 +191,18 @@ class AIConfigManager:
         for filename, query_type in prompt_files.items():
             file_path = prompts_dir / filename
             
-            logger.info(f"Checking file: {file_path}")
-            logger.info(f"File exists: {file_path.exists()}")
+            logger.info("Checking file: %s", file_path)
+            logger.info("File exists: %s", file_path.exists())
             
             if not file_path.exists():
-                logger.warning(f"Prompt file not found: {file_path}")
+                logger.warning("Prompt file not found: %s", file_path)
                 continue
             
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                 
-                logger.info(f"Loaded prompt for {query_type}: {len(data.get('template', ''))} characters")
+                logger.info("Loaded prompt for %s: %s characters", query_type, len(data.get('template', '')))
                 
                 prompts[query_type] = PromptConfig(
                     template=data.get("template", ""),
@@ -212,16 +212,16 @@ class AIConfigManager:
                 )
                 
             except Exception as e:
-                logger.error(f"Failed to load prompt {filename}: {e}")
+                logger.error("Failed to load prompt %s: %s", filename, e)
         
         # Add default prompts for missing types
         default_prompts = self._get_default_prompts()
         for query_type, prompt_config in default_prompts.items():
             if query_type not in prompts:
-                logger.info(f"Using default prompt for {query_type}")
+                logger.info("Using default prompt for %s", query_type)
                 prompts[query_type] = prompt_config
         
-        logger.info(f"Total prompts loaded: {len(prompts)}")
+        logger.info("Total prompts loaded: %s", len(prompts))
         return prompts
     
     def _load_classification_rules(self) -> List[ClassificationRule]:
@@ -229,7 +229,7 @@ class AIConfigManager:
         rules_file = self.config_dir / "classification_rules.json"
         
         if not rules_file.exists():
-            logger.warning(f"Classification rules file not found: {rules_file}")
+            logger.warning("Classification rules file not found: %s", rules_file)
             return self._get_default_classification_rules()
         
         try:
@@ -248,7 +248,7 @@ class AIConfigManager:
             return rules
             
         except Exception as e:
-            logger.error(f"Failed to load classification rules: {e}")
+            logger.error("Failed to load classification rules: %s", e)
             return self._get_default_classification_rules()
     
     def _get_default_models(self) -> Dict[str, ModelConfig]:
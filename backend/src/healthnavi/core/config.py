@@ -74,6 +74,10 @@ class SecurityConfig(BaseSettings):
     # Rate limiting
     max_login_attempts: int = Field(default=5, env="MAX_LOGIN_ATTEMPTS")
     login_lockout_minutes: int = Field(default=15, env="LOGIN_LOCKOUT_MINUTES")
+    max_verification_emails: int = Field(default=3, env="MAX_VERIFICATION_EMAILS")
+    verification_email_window_minutes: int = Field(default=60, env="VERIFICATION_EMAIL_WINDOW_MINUTES")
+    verification_resend_cooldown_seconds: int = Field(default=30, env="VERIFICATION_RESEND_COOLDOWN_SECONDS")
+    max_diagnosis_requests_per_minute: int = Field(default=20, env="MAX_DIAGNOSIS_REQUESTS_PER_MINUTE")
     
     # Google OAuth settings
     google_client_id: Optional[str] = Field(default=None, env="GOOGLE_CLIENT_ID")
@@ -144,7 +148,7 @@ class Config:
             logger.info("Configuration loaded successfully")
             
         except Exception as e:
-            logger.error(f"Configuration validation failed: {e}")
+            logger.error("Configuration validation failed: %s", e)
             raise
     
     def get_database_url(self) -> str:
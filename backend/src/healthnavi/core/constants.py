@@ -9,6 +9,8 @@ PROMPT_TOKEN_LIMIT = 16000
 # Cache Configuration
 CACHE_TTL_MINUTES = 30  # Cache responses for 30 minutes
 MAX_CACHE_SIZE = 100  # Maximum number of cached responses
+RETRIEVAL_CACHE_TTL_SECONDS = 300  # Reuse retrieved context for 5 minutes
+RETRIEVAL_CACHE_MAX_SIZE = 256  # Maximum number of cached retrievals
 
 # Context Optimization
 DEFAULT_CONTEXT_MAX_CHARS = 1200  # Default context length for optimization
@@ -24,6 +26,23 @@ RETRY_MULTIPLIER = 1
 RETRY_MIN_WAIT = 4
 RETRY_MAX_WAIT = 10
 
+# Generation Configuration (shared, never mutated per request)
+QUICK_SEARCH_GENERATION_CONFIG = {
+    "temperature": 0.2,
+    "max_output_tokens": 3000,
+    "top_p": 0.95,
+    "top_k": 20,
+    "candidate_count": 1
+}
+DEEP_SEARCH_GENERATION_CONFIG = {**QUICK_SEARCH_GENERATION_CONFIG, "max_output_tokens": 7000}
+FOLLOWUP_GENERATION_CONFIG = {
+    "temperature": 0.5,
+    "max_output_tokens": 1000,
+    "top_p": 0.9,
+    "top_k": 40,
+    "candidate_count": 1
+}
+
 QUICK_SEARCH_PROMPT = """
 YOU ARE **HEALTHNAVY**, A SENIOR CLINICAL DECISION SUPPORT SYSTEM.
 THINK LIKE A SENIOR DOCTOR - ORGANIZED, DIRECT, EVIDENCE-BASED.
@@ -193,3 +212,15 @@ AVAILABLE SOURCES: {sources}
 EVIDENCE BASE: {context}
 
 """
+
+# User-supplied part of the prompt, appended after the search prompt
+USER_CONTEXT_TEMPLATE = """
+
+### USER QUESTION:
+{query}
+
+### CONTEXT (if provided):
+{patient_data}
+
+### PREVIOUS CONVERSATION SUMMARY:
+{chat_history}"""
@@ -49,11 +49,11 @@ def get_db() -> Generator[Session, None, None]:
     try:
         yield db
     except SQLAlchemyError as e:
-        logger.error(f"Database error: {e}")
+        logger.error("Database error: %s", e)
         db.rollback()
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in database session: {e}")
+        logger.error("Unexpected error in database session: %s", e)
         db.rollback()
         raise
     finally:
@@ -76,11 +76,11 @@ def get_db_transaction():
         yield db
         db.commit()
     except SQLAlchemyError as e:
-        logger.error(f"Database transaction error: {e}")
+        logger.error("Database transaction error: %s", e)
         db.rollback()
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in database transaction: {e}")
+        logger.error("Unexpected error in database transaction: %s", e)
         db.rollback()
         raise
     finally:
@@ -95,7 +95,7 @@ def create_tables():
         Base.metadata.create_all(bind=engine)
         logger.info("Database tables created successfully")
     except SQLAlchemyError as e:
-        logger.error(f"Failed to create database tables: {e}")
+        logger.error("Failed to create database tables: %s", e)
         raise
 
 
@@ -112,7 +112,7 @@ def check_database_connection() -> bool:
         logger.info("Database connection check successful")
         return True
     except SQLAlchemyError as e:
-        logger.error(f"Database connection check failed: {e}")
+        logger.error("Database connection check failed: %s", e)
         return False
 
 
@@ -133,9 +133,9 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
 def receive_before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     """Log SQL queries in debug mode."""
     if config.application.debug:
-        logger.debug(f"SQL Query: {statement}")
+        logger.debug("SQL Query: %s", statement)
         if parameters:
-            logger.debug(f"SQL Parameters: {parameters}")
+            logger.debug("SQL Parameters: %s", parameters)
 
 
 # Initialize database on module import
@@ -152,7 +152,7 @@ def initialize_database():
         logger.info("Database initialized successfully")
         
     except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
+        logger.error("Database initialization failed: %s", e)
         raise
 
 
@@ -161,5 +161,5 @@ if config.application.environment != 'test':
     try:
         initialize_database()
     except Exception as e:
-        logger.warning(f"Database initialization failed on import: {e}")
+        logger.warning("Database initialization failed on import: %s", e)
         logger.info("Database will be initialized when first accessed")
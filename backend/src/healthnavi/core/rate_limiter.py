@@ -0,0 +1,117 @@
+"""
+Rate limiting for HealthNavi AI CDSS.
+
+Counts attempts per key in fixed windows. Failed logins are counted per
+(email, client IP) so brute-force attempts are throttled before reaching
+password verification; the same limiter caps verification emails resent
+per address and diagnosis requests per caller.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, List
+
+from healthnavi.core.config import get_config
+
+config = get_config()
+
+
+class RateLimiter:
+    """In-process fixed-window limiter counting attempts per key."""
+
+    def __init__(self, max_attempts: int, window_seconds: float, max_keys: int = 100_000):
+        """Initialize the limiter with its attempt budget, window length and key bound."""
+        self.max_attempts = max_attempts
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        # Each entry is [window_start, failure_count]. Keys are ordered by
+        # window start, so expired ones always sit at the front.
+        self._attempts: "OrderedDict[Hashable, List[float]]" = OrderedDict()
+        # Endpoints call in from threadpool workers; reentrant so try_acquire can
+        # compose the other public methods
+        self._lock = threading.RLock()
+
+    def _failures(self, key: Hashable, now: float) -> int:
+        """Return the failure count in the key's current window, dropping it once expired."""
+        entry = self._attempts.get(key)
+        if entry is None:
+            return 0
+
+        if now - entry[0] >= self.window_seconds:
+            self._attempts.pop(key, None)
+            return 0
+        return int(entry[1])
+
+    def is_allowed(self, key: Hashable) -> bool:
+        """Check whether another attempt is allowed for this key."""
+        with self._lock:
+            return self._failures(key, time.monotonic()) < self.max_attempts
+
+    def retry_after(self, key: Hashable) -> int:
+        """Return the whole seconds left until this key's current window expires."""
+        with self._lock:
+            entry = self._attempts.get(key)
+            if entry is None:
+                return 0
+            return max(0, math.ceil(self.window_seconds - (time.monotonic() - entry[0])))
+
+    def record(self, key: Hashable) -> None:
+        """Count one attempt against this key's budget."""
+        with self._lock:
+            now = time.monotonic()
+            entry = self._attempts.get(key)
+            if entry is None or now - entry[0] >= self.window_seconds:
+                # Start a new window; it is now the most recent one
+                self._attempts[key] = [now, 1]
+                self._attempts.move_to_end(key)
+            else:
+                entry[1] += 1
+            self._evict(now)
+
+    def try_acquire(self, key: Hashable) -> bool:
+        """Atomically check the budget and, if allowed, count one attempt against it."""
+        with self._lock:
+            if not self.is_allowed(key):
+                return False
+            self.record(key)
+            return True
+
+    def _evict(self, now: float) -> None:
+        """Drop keys whose window has expired, and enforce the key bound. Caller holds the lock."""
+        while self._attempts:
+            oldest_key, (window_start, _) = next(iter(self._attempts.items()))
+            if len(self._attempts) <= self.max_keys and now - window_start < self.window_seconds:
+                break
+            self._attempts.pop(oldest_key, None)
+
+    def reset(self, key: Hashable) -> None:
+        """Forget all recorded attempts for this key (e.g. after a successful login)."""
+        with self._lock:
+            self._attempts.pop(key, None)
+
+
+# Initialize login rate limiter
+login_rate_limiter = RateLimiter(
+    max_attempts=config.security.max_login_attempts,
+    window_seconds=config.security.login_lockout_minutes * 60
+)
+
+# Initialize verification email rate limiter
+verification_rate_limiter = RateLimiter(
+    max_attempts=config.security.max_verification_emails,
+    window_seconds=config.security.verification_email_window_minutes * 60
+)
+
+# Initialize verification resend cooldown (one send per address per cooldown)
+verification_resend_cooldown = RateLimiter(
+    max_attempts=1,
+    window_seconds=config.security.verification_resend_cooldown_seconds
+)
+
+# Initialize diagnosis rate limiter (per user, or per client IP when anonymous)
+diagnosis_rate_limiter = RateLimiter(
+    max_attempts=config.security.max_diagnosis_requests_per_minute,
+    window_seconds=60
+)
@@ -20,21 +20,22 @@ def create_success_response(
     
     # Wrap data in success response if it's not already wrapped
     if not isinstance(data, SuccessResponse) and message:
-        wrapped_data = SuccessResponse(
+        wrapped_data = SuccessResponse.model_construct(
             message=message,
             details=additional_details
         )
     else:
         wrapped_data = data
     
-    metadata = Metadata(
+    # Envelope fields are built here from known-good values, so skip validation
+    metadata = Metadata.model_construct(
         statusCode=status_code,
         errors=[],
         executionTime=execution_time or 0.0,
         timestamp=datetime.utcnow()
     )
     
-    return StandardResponse(
+    return StandardResponse.model_construct(
         data=wrapped_data,
         metadata=metadata,
         success=1
@@ -50,19 +51,21 @@ def create_error_response(
 ) -> StandardResponse:
     """Create a standardized error response."""
     
-    error_data = ErrorResponse(
+    # All fields are built here from known-good values, so skip Pydantic
+    # validation on the (frequent) error paths
+    error_data = ErrorResponse.model_construct(
         message=message,
         details=additional_details
     )
     
-    metadata = Metadata(
+    metadata = Metadata.model_construct(
         statusCode=status_code,
         errors=errors or [message],
         executionTime=execution_time or 0.0,
         timestamp=datetime.utcnow()
     )
     
-    return StandardResponse(
+    return StandardResponse.model_construct(
         data=error_data,
         metadata=metadata,
         success=0
@@ -100,14 +103,32 @@ class ResponseTimer:
         self.execution_time = None
     
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.execution_time = time.time() - self.start_time
+        self.execution_time = time.perf_counter() - self.start_time
     
     def get_execution_time(self) -> float:
         """Get the execution time."""
         if self.execution_time is None:
-            return time.time() - self.start_time
+            return time.perf_counter() - self.start_time
         return self.execution_time
+    
+    def success_response(self, data: Any, status_code: int = 200, **kwargs) -> StandardResponse:
+        """Create a success response stamped with the elapsed time."""
+        return create_success_response(
+            data=data,
+            status_code=status_code,
+            execution_time=self.get_execution_time(),
+            **kwargs
+        )
+    
+    def error_response(self, message: str, status_code: int = 400, **kwargs) -> StandardResponse:
+        """Create an error response stamped with the elapsed time."""
+        return create_error_response(
+            message=message,
+            status_code=status_code,
+            execution_time=self.get_execution_time(),
+            **kwargs
+        )
@@ -9,6 +9,7 @@ import os
 import secrets
 import hashlib
 import hmac
+import re
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from cryptography.fernet import Fernet
@@ -67,7 +68,7 @@ class EncryptionService:
         if not key_str:
             logger.warning("ENCRYPTION_KEY not found in environment. Generating new key.")
             key = Fernet.generate_key()
-            logger.critical(f"Generated new encryption key: {key.decode()}")
+            logger.critical("Generated new encryption key: %s", key.decode())
             logger.critical("IMPORTANT: Save this key securely and set ENCRYPTION_KEY environment variable!")
             return key
         
@@ -83,11 +84,11 @@ class EncryptionService:
                 # If that fails, generate a new key
                 logger.warning("Invalid ENCRYPTION_KEY format. Generating new key.")
                 key = Fernet.generate_key()
-                logger.critical(f"Generated new encryption key: {key.decode()}")
+                logger.critical("Generated new encryption key: %s", key.decode())
                 logger.critical("IMPORTANT: Save this key securely and set ENCRYPTION_KEY environment variable!")
                 return key
             except Exception as e:
-                logger.error(f"Failed to generate encryption key: {e}")
+                logger.error("Failed to generate encryption key: %s", e)
                 # Last resort - generate a key
                 return Fernet.generate_key()
     
@@ -114,7 +115,7 @@ class EncryptionService:
             encrypted_data = self._fernet.encrypt(data.encode('utf-8'))
             return base64.b64encode(encrypted_data).decode('utf-8')
         except Exception as e:
-            logger.error(f"Encryption failed: {e}")
+            logger.error("Encryption failed: %s", e)
             raise ValueError("Encryption failed")
     
     def decrypt_phi(self, encrypted_data: str) -> str:
@@ -135,13 +136,56 @@ class EncryptionService:
             decrypted_data = self._fernet.decrypt(decoded_data)
             return decrypted_data.decode('utf-8')
         except Exception as e:
-            logger.error(f"Decryption failed: {e}")
+            logger.error("Decryption failed: %s", e)
             raise ValueError("Decryption failed")
 
 
 class PasswordValidator:
     """Validates password strength according to medical software standards."""
     
+    SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+    
+    # Character class bits returned by _character_classes
+    HAS_UPPER = 1
+    HAS_LOWER = 2
+    HAS_DIGIT = 4
+    HAS_SPECIAL = 8
+    ALL_CLASSES = HAS_UPPER | HAS_LOWER | HAS_DIGIT | HAS_SPECIAL
+    
+    # Required classes are fixed by SecurityConfig, so resolve them once at import
+    REQUIRED_CLASSES = (
+        (HAS_UPPER if SecurityConfig.PASSWORD_REQUIREMENTS['require_uppercase'] else 0)
+        | (HAS_LOWER if SecurityConfig.PASSWORD_REQUIREMENTS['require_lowercase'] else 0)
+        | (HAS_DIGIT if SecurityConfig.PASSWORD_REQUIREMENTS['require_digits'] else 0)
+        | (HAS_SPECIAL if SecurityConfig.PASSWORD_REQUIREMENTS['require_special_chars'] else 0)
+    )
+    CLASS_ERRORS = (
+        (HAS_UPPER, "Password must contain at least one uppercase letter"),
+        (HAS_LOWER, "Password must contain at least one lowercase letter"),
+        (HAS_DIGIT, "Password must contain at least one digit"),
+        (HAS_SPECIAL, "Password must contain at least one special character"),
+    )
+    
+    @staticmethod
+    def _character_classes(password: str) -> int:
+        """Return a bitmask of the character classes present, in a single pass."""
+        flags = 0
+        special_chars = PasswordValidator.SPECIAL_CHARS
+        for c in password:
+            if c.isupper():
+                flags |= PasswordValidator.HAS_UPPER
+            elif c.islower():
+                flags |= PasswordValidator.HAS_LOWER
+            elif c.isdigit():
+                flags |= PasswordValidator.HAS_DIGIT
+            elif c in special_chars:
+                flags |= PasswordValidator.HAS_SPECIAL
+            else:
+                continue
+            if flags == PasswordValidator.ALL_CLASSES:
+                break
+        return flags
+    
     @staticmethod
     def validate_password(password: str) -> Dict[str, Any]:
         """
@@ -164,19 +208,10 @@ class PasswordValidator:
             errors.append(f"Password must be no more than {requirements['max_length']} characters")
         
         # Character requirements
-        if requirements['require_uppercase'] and not any(c.isupper() for c in password):
-            errors.append("Password must contain at least one uppercase letter")
-        
-        if requirements['require_lowercase'] and not any(c.islower() for c in password):
-            errors.append("Password must contain at least one lowercase letter")
-        
-        if requirements['require_digits'] and not any(c.isdigit() for c in password):
-            errors.append("Password must contain at least one digit")
-        
-        if requirements['require_special_chars']:
-            special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-            if not any(c in special_chars for c in password):
-                errors.append("Password must contain at least one special character")
+        classes = PasswordValidator._character_classes(password)
+        missing = PasswordValidator.REQUIRED_CLASSES & ~classes
+        if missing:
+            errors.extend(message for bit, message in PasswordValidator.CLASS_ERRORS if missing & bit)
         
         # Forbidden patterns
         password_lower = password.lower()
@@ -185,33 +220,29 @@ class PasswordValidator:
                 errors.append(f"Password cannot contain '{pattern}'")
         
         # Additional security checks
-        if password.count(password[0]) > len(password) * 0.5:
+        if password and password.count(password[0]) > len(password) * 0.5:
             warnings.append("Password has too many repeated characters")
         
         return {
             'is_valid': len(errors) == 0,
             'errors': errors,
             'warnings': warnings,
-            'strength_score': PasswordValidator._calculate_strength_score(password)
+            'strength_score': PasswordValidator._calculate_strength_score(password, classes)
         }
     
     @staticmethod
-    def _calculate_strength_score(password: str) -> int:
+    def _calculate_strength_score(password: str, classes: Optional[int] = None) -> int:
         """Calculate password strength score (0-100)."""
+        if classes is None:
+            classes = PasswordValidator._character_classes(password)
+        
         score = 0
         
         # Length score
         score += min(len(password) * 2, 40)
         
-        # Character variety
-        if any(c.isupper() for c in password):
-            score += 10
-        if any(c.islower() for c in password):
-            score += 10
-        if any(c.isdigit() for c in password):
-            score += 10
-        if any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
-            score += 10
+        # Character variety (10 points per class present)
+        score += 10 * bin(classes).count("1")
         
         # Complexity bonus
         unique_chars = len(set(password))
@@ -223,14 +254,14 @@ class PasswordValidator:
 class SecureLogger:
     """Secure logging utility that prevents PHI leakage."""
     
-    # Patterns that might indicate PHI
+    # Patterns that might indicate PHI (compiled once at import)
     PHI_PATTERNS = [
-        r'\b\d{3}-\d{2}-\d{4}\b',  # SSN
-        r'\b\d{4}\s\d{4}\s\d{4}\s\d{4}\b',  # Credit card
-        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Email
-        r'\b\d{3}-\d{3}-\d{4}\b',  # Phone
-        r'\b\d{1,2}/\d{1,2}/\d{4}\b',  # Date
-        r'\b(?:Mr|Mrs|Ms|Dr)\.?\s+[A-Z][a-z]+\s+[A-Z][a-z]+\b',  # Name with title
+        re.compile(r'\b\d{3}-\d{2}-\d{4}\b', re.IGNORECASE),  # SSN
+        re.compile(r'\b\d{4}\s\d{4}\s\d{4}\s\d{4}\b', re.IGNORECASE),  # Credit card
+        re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.IGNORECASE),  # Email
+        re.compile(r'\b\d{3}-\d{3}-\d{4}\b', re.IGNORECASE),  # Phone
+        re.compile(r'\b\d{1,2}/\d{1,2}/\d{4}\b', re.IGNORECASE),  # Date
+        re.compile(r'\b(?:Mr|Mrs|Ms|Dr)\.?\s+[A-Z][a-z]+\s+[A-Z][a-z]+\b', re.IGNORECASE),  # Name with title
     ]
     
     @staticmethod
@@ -244,11 +275,9 @@ class SecureLogger:
         Returns:
             Sanitized message with PHI replaced by [REDACTED]
         """
-        import re
-        
         sanitized = message
         for pattern in SecureLogger.PHI_PATTERNS:
-            sanitized = re.sub(pattern, '[REDACTED]', sanitized, flags=re.IGNORECASE)
+            sanitized = pattern.sub('[REDACTED]', sanitized)
         
         return sanitized
     
@@ -290,6 +319,14 @@ class SecureLogger:
 class InputValidator:
     """Validates and sanitizes user inputs."""
     
+    # Potentially malicious content patterns (compiled once at import)
+    DANGEROUS_PATTERNS = [
+        re.compile(r'<script.*?>.*?</script>', re.IGNORECASE),  # Script tags
+        re.compile(r'javascript:', re.IGNORECASE),  # JavaScript protocol
+        re.compile(r'data:text/html', re.IGNORECASE),  # Data URLs
+        re.compile(r'vbscript:', re.IGNORECASE),  # VBScript
+    ]
+    
     @staticmethod
     def validate_patient_data(data: str) -> Dict[str, Any]:
         """
@@ -314,16 +351,8 @@ class InputValidator:
             }
         
         # Check for potentially malicious content
-        dangerous_patterns = [
-            r'<script.*?>.*?</script>',  # Script tags
-            r'javascript:',  # JavaScript protocol
-            r'data:text/html',  # Data URLs
-            r'vbscript:',  # VBScript
-        ]
-        
-        import re
-        for pattern in dangerous_patterns:
-            if re.search(pattern, data, re.IGNORECASE):
+        for pattern in InputValidator.DANGEROUS_PATTERNS:
+            if pattern.search(data):
                 return {'is_valid': False, 'error': 'Invalid content detected'}
         
         return {'is_valid': True, 'sanitized_data': InputValidator._sanitize_text(data)}
@@ -53,7 +53,7 @@ class SimpleConfig:
             self.ai = SimpleAIConfig()
             logger.info("Simple configuration loaded successfully")
         except Exception as e:
-            logger.error(f"Configuration loading failed: {e}")
+            logger.error("Configuration loading failed: %s", e)
             raise
     
     def get_temperature(self, query_type: str) -> float:
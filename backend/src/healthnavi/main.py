@@ -2,21 +2,48 @@
 Main FastAPI application for HealthNavi AI CDSS.
 """
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers
 import time
 
 from healthnavi.core.config import get_config
-from healthnavi.core.response_utils import create_success_response, create_error_response, ResponseTimer
+from healthnavi.core.response_utils import create_error_response, ResponseTimer
 from healthnavi.schemas import StandardResponse
 from healthnavi.api.v1 import auth, diagnosis, chat_sessions
 
 config = get_config()
 logger = logging.getLogger(__name__)
 
+# Interval between sweeps for expired password reset tokens
+TOKEN_SWEEP_INTERVAL_SECONDS = 3600
+
+
+def _purge_expired_tokens() -> int:
+    """Run one expired-token purge in its own database session."""
+    from healthnavi.core.database import SessionLocal
+    db = SessionLocal()
+    try:
+        return auth.purge_expired_password_reset_tokens(db)
+    finally:
+        db.close()
+
+
+async def _sweep_expired_tokens():
+    """Periodically clear expired password reset tokens off the request path."""
+    while True:
+        try:
+            purged = await asyncio.to_thread(_purge_expired_tokens)
+            if purged:
+                logger.info("Purged %d expired password reset tokens", purged)
+        except Exception as e:
+            logger.warning("Expired token sweep failed: %s", e)
+        await asyncio.sleep(TOKEN_SWEEP_INTERVAL_SECONDS)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -28,7 +55,7 @@ async def lifespan(app: FastAPI):
         initialize_database()
         logger.info("Database initialization completed")
     except Exception as e:
-        logger.warning(f"Database initialization failed during startup: {e}")
+        logger.warning("Database initialization failed during startup: %s", e)
         logger.info("Application will continue - database will be initialized on first access")
     
     try:
@@ -36,7 +63,7 @@ async def lifespan(app: FastAPI):
         initialize_vectorstore()
         logger.info("Vector store initialization completed")
     except Exception as e:
-        logger.warning(f"Vector store initialization failed during startup: {e}")
+        logger.warning("Vector store initialization failed during startup: %s", e)
         logger.info("Application will continue - AI will work without RAG context")
     
     try:
@@ -44,15 +71,21 @@ async def lifespan(app: FastAPI):
         initialize_genai_client()
         logger.info("GenAI client initialization completed")
     except Exception as e:
-        logger.warning(f"GenAI client initialization failed during startup: {e}")
+        logger.warning("GenAI client initialization failed during startup: %s", e)
         logger.info("Application will continue - AI functionality may be limited")
     
+    token_sweep_task = asyncio.create_task(_sweep_expired_tokens())
+
     logger.info("Application startup completed successfully")
-    
+
     yield
-    
+
     # Shutdown
     logger.info("Shutting down HealthNavi AI CDSS application...")
+    token_sweep_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await token_sweep_task
+    auth.google_http_client.close()
 
 
 # Create FastAPI application
@@ -61,8 +94,59 @@ app = FastAPI(
     description=config.application.app_description,
     version=config.application.app_version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Largest request body accepted. DiagnosisInput allows 60k characters in
+# total, so this leaves room for JSON escaping of non-ASCII text
+MAX_REQUEST_BODY_BYTES = 512 * 1024
+
+
+class RequestSizeLimitMiddleware:
+    """Reject request bodies larger than max_body_bytes, with or without Content-Length."""
+    
+    def __init__(self, app, max_body_bytes: int):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Declared size: reject before any of the body is read
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            error_response = create_error_response(
+                message="Request body too large",
+                status_code=413
+            )
+            response = ORJSONResponse(
+                status_code=413,
+                content=error_response.model_dump(mode='json')
+            )
+            await response(scope, receive, send)
+            return
+        
+        # Chunked or understated bodies: count bytes as they are read. The
+        # HTTPException reaches the app's handler, which renders the 413 envelope
+        received = 0
+        
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    raise HTTPException(status_code=413, detail="Request body too large")
+            return message
+        
+        await self.app(scope, limited_receive, send)
+
+
+# Request size limit middleware, added before CORS so the 413 still carries CORS headers
+app.add_middleware(RequestSizeLimitMiddleware, max_body_bytes=MAX_REQUEST_BODY_BYTES)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -77,17 +161,17 @@ app.add_middleware(
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all requests."""
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Log request
-    logger.info(f"Request: {request.method} {request.url}")
+    logger.info("Request: %s %s", request.method, request.url)
     
     # Process request
     response = await call_next(request)
     
     # Log response
-    process_time = time.time() - start_time
-    logger.info(f"Response: {response.status_code} - {process_time:.3f}s")
+    process_time = time.perf_counter() - start_time
+    logger.info("Response: %s - %.3fs", response.status_code, process_time)
     
     return response
 
@@ -96,7 +180,7 @@ async def log_requests(request: Request, call_next):
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """HTTP exception handler."""
-    logger.warning(f"HTTP exception: {exc.status_code} - {exc.detail}")
+    logger.warning("HTTP exception: %s - %s", exc.status_code, exc.detail)
     
     # Create standardized error response
     error_response = create_error_response(
@@ -106,9 +190,10 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         execution_time=0.0
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=error_response.model_dump(mode='json')
+        content=error_response.model_dump(mode='json'),
+        headers=exc.headers
     )
 
 
@@ -116,17 +201,16 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     
     # Create standardized error response
     error_response = create_error_response(
         message="Internal server error",
         status_code=500,
-        errors=[str(exc)],
         execution_time=0.0
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content=error_response.model_dump(mode='json')
     )
@@ -144,10 +228,9 @@ async def health_check():
             "environment": config.application.environment
         }
         
-        return create_success_response(
+        return timer.success_response(
             data=health_data,
-            status_code=200,
-            execution_time=timer.get_execution_time()
+            status_code=200
         )
 
 API_VERSION_PREFIX = "/api/v2"
@@ -17,7 +17,7 @@ class DiagnosisSession(Base):
     """
     __tablename__ = "diagnosis_sessions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     session_name = Column(String(255), nullable=True)
     patient_summary = Column(Text, nullable=True)
@@ -30,7 +30,7 @@ class DiagnosisSession(Base):
     chat_messages = relationship("ChatMessage", back_populates="session", cascade="all, delete-orphan")
 
     def __repr__(self):
-        return f"<DiagnosisSession(id={self.id}, user_id={self.user_id}, name='{self.session_name}')>"
+        return "<DiagnosisSession(id=%s, user_id=%s)>" % (self.id, self.user_id)
 
 
 class ChatMessage(Base):
@@ -40,7 +40,7 @@ class ChatMessage(Base):
     """
     __tablename__ = "chat_messages"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     session_id = Column(Integer, ForeignKey("diagnosis_sessions.id"), nullable=False, index=True)
     message_type = Column(String(20), nullable=False)  # 'user', 'assistant', or 'system'
     content = Column(Text, nullable=False)
@@ -53,7 +53,7 @@ class ChatMessage(Base):
     feedback = relationship("MessageFeedback", back_populates="message", cascade="all, delete-orphan", uselist=False)
 
     def __repr__(self):
-        return f"<ChatMessage(id={self.id}, session_id={self.session_id}, type='{self.message_type}')>"
+        return "<ChatMessage(id=%s, session_id=%s, type=%r)>" % (self.id, self.session_id, self.message_type)
 
 
 class MessageFeedback(Base):
@@ -63,7 +63,7 @@ class MessageFeedback(Base):
     """
     __tablename__ = "message_feedback"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     message_id = Column(Integer, ForeignKey("chat_messages.id"), nullable=False, unique=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     feedback_type = Column(String(20), nullable=False)  # 'helpful' or 'not_helpful'
@@ -75,4 +75,4 @@ class MessageFeedback(Base):
     user = relationship("User")
 
     def __repr__(self):
-        return f"<MessageFeedback(id={self.id}, message_id={self.message_id}, feedback_type='{self.feedback_type}')>"
\ No newline at end of file
+        return "<MessageFeedback(id=%s, message_id=%s, feedback_type=%r)>" % (self.id, self.message_id, self.feedback_type)
\ No newline at end of file
@@ -2,7 +2,7 @@
 User model for HealthNavi AI CDSS.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Identity, DDL, event
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -13,7 +13,7 @@ class User(Base):
     """User model with role-based access control."""
     __tablename__ = "users"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, Identity(always=True, cache=1000), primary_key=True)
     username = Column(String(50), unique=True, index=True, nullable=False)
     full_name = Column(String(100), nullable=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -21,8 +21,8 @@ class User(Base):
     google_id = Column(String(255), unique=True, index=True, nullable=True)  # Google OAuth ID
     is_active = Column(Boolean, default=True, nullable=False)
     is_email_verified = Column(Boolean, default=False, nullable=False)
-    email_verification_token = Column(String(255), nullable=True)
-    password_reset_token = Column(String(255), nullable=True)
+    email_verification_token = Column(String(255), index=True, nullable=True)
+    password_reset_token = Column(String(255), index=True, nullable=True)
     password_reset_expires = Column(String, nullable=True)  # Will store ISO datetime string
     role = Column(String(20), default="user", nullable=False)
     created_at = Column(String, nullable=True)  # Will store ISO datetime string
@@ -42,7 +42,7 @@ class User(Base):
         return str(self.updated_at) if self.updated_at else ""
     
     def __repr__(self):
-        return f"<User(id={self.id}, username='{self.username}', email='{self.email}', role='{self.role}', active={self.is_active})>"
+        return "<User(id=%s, email=%r)>" % (self.id, self.email)
     
     def is_admin(self) -> bool:
         """Check if user is an admin."""
@@ -51,3 +51,12 @@ class User(Base):
     def is_super_admin(self) -> bool:
         """Check if user is a super admin."""
         return self.role == "super_admin"
+
+
+# Leave 20% free space per page so frequent updates to unindexed columns
+# (updated_at, is_email_verified) can be HOT updates that skip index maintenance
+event.listen(
+    User.__table__,
+    "after_create",
+    DDL("ALTER TABLE users SET (fillfactor = 80)").execute_if(dialect="postgresql")
+)
@@ -5,6 +5,7 @@ Pydantic schemas for request/response validation.
 from pydantic import BaseModel, Field, EmailStr
 from typing import Optional, Dict, Any, Generic, TypeVar, List, Union
 from datetime import datetime
+import json
 import time
 
 # Generic type for response data
@@ -27,7 +28,6 @@ class Metadata(BaseModel):
     
     def model_dump_json(self, **kwargs):
         """Custom JSON dump to handle datetime serialization."""
-        import json
         data = self.model_dump(**kwargs)
         return json.dumps(data, default=str)
 
@@ -128,7 +128,7 @@ class ChatSessionListResponse(BaseModel):
 class MessageFeedbackRequest(BaseModel):
     """Schema for submitting message feedback."""
     message_id: int = Field(..., description="ID of the chat message to provide feedback for")
-    feedback_type: str = Field(..., description="Type of feedback: 'helpful' or 'not_helpful'")
+    feedback_type: str = Field(..., pattern=r"^(helpful|not_helpful)$", description="Type of feedback: 'helpful' or 'not_helpful'")
 
 
 class MessageFeedbackResponse(BaseModel):
@@ -155,7 +155,6 @@ class UserCreate(BaseModel):
         """Generate username and full_name from first_name and last_name if not provided."""
         if not self.username and self.first_name and self.last_name:
             # Generate username from first and last name with timestamp for uniqueness
-            from datetime import datetime
             timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
             self.username = f"{self.first_name.lower()}.{self.last_name.lower()}.{timestamp}"
         
@@ -1,4 +1,5 @@
 import os
+import re
 import time
 import logging
 import asyncio
@@ -8,16 +9,17 @@ from healthnavi.services.genai_client import get_genai_client
 from healthnavi.services.vectorstore_manager import search_all_collections
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_not_exception_type
 from dotenv import load_dotenv
-from typing import Dict, Tuple
+from collections import OrderedDict
+from typing import Optional, Tuple
 from google.api_core import exceptions
 from enum import Enum
-from datetime import datetime, timedelta
 
 from healthnavi.core.constants import (
     MODEL_NAME, PROMPT_TOKEN_LIMIT, CACHE_TTL_MINUTES, MAX_CACHE_SIZE,
     DEFAULT_CONTEXT_MAX_CHARS, BALANCED_CONTEXT_MAX_CHARS,
     MAX_RETRY_ATTEMPTS, RETRY_MULTIPLIER, RETRY_MIN_WAIT, RETRY_MAX_WAIT,
-    QUICK_SEARCH_PROMPT, DEEP_SEARCH_PROMPT
+    QUICK_SEARCH_PROMPT, DEEP_SEARCH_PROMPT, USER_CONTEXT_TEMPLATE,
+    QUICK_SEARCH_GENERATION_CONFIG, DEEP_SEARCH_GENERATION_CONFIG, FOLLOWUP_GENERATION_CONFIG
 )
 
 logging.basicConfig(
@@ -28,8 +30,14 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 load_dotenv()
 
-# Simple in-memory cache for responses
-RESPONSE_CACHE: Dict[str, Tuple[str, datetime]] = {}
+# Simple in-memory LRU cache of (response, follow-up questions, cached_at) per query
+RESPONSE_CACHE: "OrderedDict[str, Tuple[str, list[str], float]]" = OrderedDict()
+CACHE_TTL_SECONDS = CACHE_TTL_MINUTES * 60
+
+# Header lines the model sometimes emits before the follow-up questions
+FOLLOWUP_SKIP_PHRASES = ('follow-up questions', 'here are', 'following questions')
+# Leading numbering/bullets on each follow-up question line
+FOLLOWUP_NUMBERING_PATTERN = re.compile(r'^[\d.\-*•)\s]+')
     
 
 def optimize_context_for_llm(chunks: list[dict], max_chunks: int = 3) -> str:
@@ -53,7 +61,6 @@ def generate_followup_questions_sync(original_query: str, response: str) -> list
     """
     Generate 3-4 relevant follow-up questions based on the original query and AI response.
     """
-    import re
     client = get_genai_client()
     
     try:
@@ -70,35 +77,29 @@ def generate_followup_questions_sync(original_query: str, response: str) -> list
         followup_response = client.models.generate_content(
             model=MODEL_NAME,
             contents=[{"role": "user", "parts": [{"text": followup_prompt}]}],
-            config={
-                "temperature": 0.5,
-                "max_output_tokens": 1000,  
-                "top_p": 0.9,
-                "top_k": 40,
-                "candidate_count": 1
-            }
+            config=FOLLOWUP_GENERATION_CONFIG
         )
         
-        logger.info(f"Follow-up response received: {followup_response}")
+        logger.info("Follow-up response received: %s", followup_response)
         
         if followup_response and hasattr(followup_response, 'candidates') and followup_response.candidates:
             candidate = followup_response.candidates[0]
-            logger.info(f"Candidate: {candidate}")
-            logger.info(f"Finish reason: {getattr(candidate, 'finish_reason', 'unknown')}")
+            logger.info("Candidate: %s", candidate)
+            logger.info("Finish reason: %s", getattr(candidate, 'finish_reason', 'unknown'))
             
             if hasattr(candidate, 'content') and hasattr(candidate.content, 'parts') and candidate.content.parts:
                 questions_text = candidate.content.parts[0].text.strip()
-                logger.info(f"Raw questions text: {questions_text}")
+                logger.info("Raw questions text: %s", questions_text)
                 
                 questions = []
                 lines = [q.strip() for q in questions_text.split('\n') if q.strip()]
                 
                 for line in lines:
                     # Remove numbering/bullets 
-                    cleaned = re.sub(r'^[\d.\-*•)\s]+', '', line).strip()
+                    cleaned = FOLLOWUP_NUMBERING_PATTERN.sub('', line).strip()
                     
                     # Skip intro/header lines
-                    if any(skip in cleaned.lower() for skip in ['follow-up questions', 'here are', 'following questions']):
+                    if any(skip in cleaned.lower() for skip in FOLLOWUP_SKIP_PHRASES):
                         continue
                     
                     # Accept any line that looks like a question (minimum 20 chars for a real question)
@@ -106,19 +107,19 @@ def generate_followup_questions_sync(original_query: str, response: str) -> list
                         if not cleaned.endswith('?'):
                             cleaned = cleaned.rstrip('.') + '?'
                         questions.append(cleaned)
-                        logger.info(f"Parsed question: {cleaned}")
+                        logger.info("Parsed question: %s", cleaned)
                 
                 if questions:
                     result = questions[:4]
-                    logger.info(f"Returning {len(result)} follow-up questions")
+                    logger.info("Returning %s follow-up questions", len(result))
                     return result
             else:
-                logger.warning(f"No content parts. Candidate content: {getattr(candidate, 'content', 'none')}")
+                logger.warning("No content parts. Candidate content: %s", getattr(candidate, 'content', 'none'))
         else:
-            logger.warning(f"No candidates in response")
+            logger.warning("No candidates in response")
             
     except Exception as e:
-        logger.error(f"Error generating follow-up questions: {e}", exc_info=True)
+        logger.error("Error generating follow-up questions: %s", e, exc_info=True)
     
     logger.warning("Could not generate follow-up questions")
     return []
@@ -131,32 +132,32 @@ def _generate_cache_key(query: str, patient_data: str, deep_search: bool = False
     return hashlib.md5(combined.encode()).hexdigest()
 
 
-def _get_cached_response(cache_key: str) -> str:
-    """Get cached response if available and not expired."""
-    if cache_key in RESPONSE_CACHE:
-        response, timestamp = RESPONSE_CACHE[cache_key]
-        if datetime.now() - timestamp < timedelta(minutes=CACHE_TTL_MINUTES):
-            logger.info(f"Cache HIT - Returning cached response (age: {(datetime.now() - timestamp).seconds}s)")
-            return response
-        else:
-            # Expired, remove from cache
-            del RESPONSE_CACHE[cache_key]
-            logger.info("Cache EXPIRED - Will generate new response")
-    return None
+def _get_cached_response(cache_key: str) -> Optional[Tuple[str, list[str]]]:
+    """Get the cached response and follow-up questions if available and not expired."""
+    entry = RESPONSE_CACHE.get(cache_key)
+    if entry is None:
+        return None
+    
+    response, followup_questions, cached_at = entry
+    age = time.monotonic() - cached_at
+    if age >= CACHE_TTL_SECONDS:
+        # Expired, remove from cache
+        RESPONSE_CACHE.pop(cache_key, None)
+        logger.info("Cache EXPIRED - Will generate new response")
+        return None
+    
+    RESPONSE_CACHE.move_to_end(cache_key)
+    logger.info("Cache HIT - Returning cached response (age: %.0fs)", age)
+    return response, list(followup_questions)
 
 
-def _cache_response(cache_key: str, response: str):
-    """Cache a response with timestamp."""
-    RESPONSE_CACHE[cache_key] = (response, datetime.now())
-    logger.info(f"Response cached (cache size: {len(RESPONSE_CACHE)} entries)")
-    
-    # Cleanup old entries if cache gets too large
-    if len(RESPONSE_CACHE) > MAX_CACHE_SIZE:
-        # Remove oldest entries
-        sorted_keys = sorted(RESPONSE_CACHE.keys(), key=lambda k: RESPONSE_CACHE[k][1])
-        for key in sorted_keys[:20]:  # Remove 20 oldest
-            del RESPONSE_CACHE[key]
-        logger.info(f"🧹 Cache cleanup - Removed 20 oldest entries")
+def _cache_response(cache_key: str, response: str, followup_questions: list[str]):
+    """Cache a response and its follow-up questions, evicting the least recently used entry."""
+    RESPONSE_CACHE[cache_key] = (response, list(followup_questions), time.monotonic())
+    RESPONSE_CACHE.move_to_end(cache_key)
+    while len(RESPONSE_CACHE) > MAX_CACHE_SIZE:
+        RESPONSE_CACHE.popitem(last=False)
+    logger.info("Response cached (cache size: %s entries)", len(RESPONSE_CACHE))
 
 
 @retry(
@@ -166,7 +167,7 @@ def _cache_response(cache_key: str, response: str):
     retry=retry_if_not_exception_type(HTTPException)
 )
 async def generate_response(query: str, chat_history: str, patient_data: str, deep_search: bool = False) -> tuple[str, bool, str, list[str]]:
-    total_start_time = time.time()
+    total_start_time = time.perf_counter()
     full_response_text = ""
     actual_sources = []
     try:
@@ -174,17 +175,12 @@ async def generate_response(query: str, chat_history: str, patient_data: str, de
         cache_key = None
         if not chat_history or chat_history == "No previous conversation":
             cache_key = _generate_cache_key(query, patient_data, deep_search)
-            cached_response = _get_cached_response(cache_key)
-            if cached_response:
-                logger.info(f"⚡ Cached response returned in {time.time() - total_start_time:.3f}s")
+            cached = _get_cached_response(cache_key)
+            if cached:
+                cached_response, followup_questions = cached
+                logger.info("⚡ Cached response returned in %.3fs", time.perf_counter() - total_start_time)
                 diagnosis_complete = is_diagnosis_complete(cached_response)
                 prompt_type = "deep_search" if deep_search else "quick_search"
-                # Generate follow-up questions even for cached responses
-                followup_questions = []
-                try:
-                    followup_questions = generate_followup_questions_sync(query, cached_response)
-                except Exception as e:
-                    logger.warning(f"Failed to generate follow-up questions for cached response: {e}")
                 return cached_response, diagnosis_complete, prompt_type, followup_questions
 
         # Adjust chunks and sources based on search type
@@ -194,7 +190,7 @@ async def generate_response(query: str, chat_history: str, patient_data: str, de
             max_books = 8
             min_chunks = 10
             min_books = 5
-            max_output_tokens = 7000
+            generation_config = DEEP_SEARCH_GENERATION_CONFIG
             prompt_template = DEEP_SEARCH_PROMPT
             prompt_type = "deep_search"
             logger.info("🔍 Using DEEP SEARCH mode")
@@ -203,11 +199,13 @@ async def generate_response(query: str, chat_history: str, patient_data: str, de
             max_books = 4
             min_chunks = 5
             min_books = 3
-            max_output_tokens = 3000
+            generation_config = QUICK_SEARCH_GENERATION_CONFIG
             prompt_template = QUICK_SEARCH_PROMPT
             prompt_type = "quick_search"
         
-        context, actual_sources = search_all_collections(
+        # Retrieval blocks on the embedding and vector store calls, so run it off the event loop
+        context, actual_sources = await asyncio.to_thread(
+            search_all_collections,
             query, 
             patient_data, 
             max_chunks=max_chunks,
@@ -216,46 +214,34 @@ async def generate_response(query: str, chat_history: str, patient_data: str, de
             min_books=min_books
         )
         optimized_context = optimize_context_for_llm(context, max_chunks=max_chunks)
-        logger.info(f"Context optimized: {len(context)} chunks -> {len(optimized_context)} chars from {len(actual_sources)} sources")
+        logger.info("Context optimized: %s chunks -> %s chars from %s sources", len(context), len(optimized_context), len(actual_sources))
 
         sources_text = ", ".join(actual_sources) if actual_sources else "No sources available"
 
-        full_prompt = prompt_template.format(sources=sources_text, context=optimized_context)
-        user_context_block = f"""
-            ### USER QUESTION:
-            {query}
-
-            ### CONTEXT (if provided):
-            {patient_data or 'No additional context provided.'}
-
-            ### PREVIOUS CONVERSATION SUMMARY:
-            {chat_history or 'No previous conversation.'}
-            """
-        full_prompt += f"\n\n{user_context_block.strip()}"
+        full_prompt = prompt_template.format(sources=sources_text, context=optimized_context) + USER_CONTEXT_TEMPLATE.format(
+            query=query,
+            patient_data=patient_data or 'No additional context provided.',
+            chat_history=chat_history or 'No previous conversation.'
+        )
 
-        logger.info(f"--- PROMPT SENT TO API (first 500 chars) ---\n{full_prompt[:500]}\n...")
+        logger.info("--- PROMPT SENT TO API (first 500 chars) ---\n%s\n...", full_prompt[:500])
 
         client = get_genai_client()
 
-        llm_start = time.time()
+        llm_start = time.perf_counter()
         logger.info("Generating response from model...")
 
         try:
-            response = client.models.generate_content(
+            response = await asyncio.to_thread(
+                client.models.generate_content,
                 model=MODEL_NAME,
                 contents=[{"role": "user", "parts": [{"text": full_prompt}]}],
-                config={
-                    "temperature": 0.2,
-                    "max_output_tokens": max_output_tokens,
-                    "top_p": 0.95,
-                    "top_k": 20,
-                    "candidate_count": 1
-                }
+                config=generation_config
             )
         except Exception as e:
-            logger.error(f"Failed to generate content: {e}", exc_info=True)
+            logger.error("Failed to generate content: %s", e, exc_info=True)
             prompt_type = "deep_search" if deep_search else "quick_search"
-            return f"⚠️ Failed to generate content: {str(e)}", False, prompt_type, []
+            return "⚠️ Failed to generate content. Please try again.", False, prompt_type, []
 
         try:
             if response and hasattr(response, 'candidates') and response.candidates:
@@ -268,7 +254,7 @@ async def generate_response(query: str, chat_history: str, patient_data: str, de
 
                 full_response_text = candidate.content.parts[0].text.strip()
                 finish_reason = getattr(candidate, 'finish_reason', 'UNKNOWN')
-                logger.info(f"Response finish reason: {finish_reason}")
+                logger.info("Response finish reason: %s", finish_reason)
 
                 if finish_reason == 'MAX_TOKENS':
                     full_response_text += "\n\n**[Note: The response was truncated due to token limits. Try asking a more specific question.]**"
@@ -281,16 +267,12 @@ async def generate_response(query: str, chat_history: str, patient_data: str, de
                 return "⚠️ No valid response was generated. Please try again.", False, prompt_type, []
 
         except Exception as e:
-            logger.error(f"Error processing model output: {e}", exc_info=True)
+            logger.error("Error processing model output: %s", e, exc_info=True)
             prompt_type = "deep_search" if deep_search else "quick_search"
-            return f"An error occurred while processing the response: {str(e)}", False, prompt_type, []
-
-        # Cache the response for future use
-        if cache_key and full_response_text:
-            _cache_response(cache_key, full_response_text)
+            return "An error occurred while processing the response. Please try again.", False, prompt_type, []
 
-        logger.info(f"✅ Response generated successfully in {time.time() - llm_start:.3f}s")
-        logger.info(f"Full pipeline completed in {time.time() - total_start_time:.3f}s")
+        logger.info("✅ Response generated successfully in %.3fs", time.perf_counter() - llm_start)
+        logger.info("Full pipeline completed in %.3fs", time.perf_counter() - total_start_time)
 
         # Determine if diagnosis is complete
         diagnosis_complete = is_diagnosis_complete(full_response_text)
@@ -298,13 +280,17 @@ async def generate_response(query: str, chat_history: str, patient_data: str, de
         # Generate follow-up questions from the response
         followup_questions = []
         try:
-            followup_questions = generate_followup_questions_sync(query, full_response_text)
+            followup_questions = await asyncio.to_thread(generate_followup_questions_sync, query, full_response_text)
         except Exception as e:
-            logger.warning(f"Failed to generate follow-up questions: {e}")
+            logger.warning("Failed to generate follow-up questions: %s", e)
+        
+        # Cache the response and its follow-ups so a repeat query skips both model calls
+        if cache_key and full_response_text:
+            _cache_response(cache_key, full_response_text, followup_questions)
         
         return full_response_text, diagnosis_complete, prompt_type, followup_questions
 
     except Exception as e:
-        logger.error(f"FATAL error in generate_response: {e}", exc_info=True)
+        logger.error("FATAL error in generate_response: %s", e, exc_info=True)
         prompt_type = "deep_search" if deep_search else "quick_search"
-        return f"🚨 Unexpected error: {str(e)}", False, prompt_type, []
+        return "🚨 An unexpected error occurred. Please try again.", False, prompt_type, []
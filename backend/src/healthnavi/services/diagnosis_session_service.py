@@ -21,6 +21,38 @@ from healthnavi.schemas import (
 logger = logging.getLogger(__name__)
 
 
+def session_to_response(session: DiagnosisSession, message_count: Optional[int]) -> ChatSessionResponse:
+    """
+    Build a ChatSessionResponse from a DiagnosisSession row.
+    
+    Database values are already validated, so the per-field Pydantic
+    validation pass is skipped.
+    """
+    return ChatSessionResponse.model_construct(
+        id=session.id,
+        user_id=session.user_id,
+        session_name=session.session_name,
+        patient_summary=session.patient_summary,
+        is_active=session.is_active,
+        created_at=session.created_at,
+        updated_at=session.updated_at,
+        message_count=message_count or 0
+    )
+
+
+def message_to_response(message: ChatMessage) -> ChatMessageResponse:
+    """Build a ChatMessageResponse from a ChatMessage row without re-validating it."""
+    return ChatMessageResponse.model_construct(
+        id=message.id,
+        session_id=message.session_id,
+        message_type=message.message_type,
+        content=message.content,
+        patient_data=message.patient_data,
+        diagnosis_complete=message.diagnosis_complete,
+        created_at=message.created_at
+    )
+
+
 class DiagnosisSessionService:
     """Service for managing diagnosis sessions and chat messages."""
     
@@ -31,34 +63,26 @@ class DiagnosisSessionService:
         """Create a new diagnosis session."""
         try:
             # Create new session
+            now = datetime.utcnow().isoformat()
             new_session = DiagnosisSession(
                 user_id=user.id,
                 session_name=session_data.session_name,
                 patient_summary=session_data.patient_summary,
                 is_active=True,
-                created_at=datetime.utcnow().isoformat(),
-                updated_at=datetime.utcnow().isoformat()
+                created_at=now,
+                updated_at=now
             )
             
             self.db.add(new_session)
             self.db.commit()
             self.db.refresh(new_session)
             
-            logger.info(f"Created new diagnosis session {new_session.id} for user {user.id}")
-            
-            return ChatSessionResponse(
-                id=new_session.id,
-                user_id=new_session.user_id,
-                session_name=new_session.session_name,
-                patient_summary=new_session.patient_summary,
-                is_active=new_session.is_active,
-                created_at=new_session.created_at,
-                updated_at=new_session.updated_at,
-                message_count=0
-            )
+            logger.info("Created new diagnosis session %s for user %s", new_session.id, user.id)
+            
+            return session_to_response(new_session, 0)
             
         except Exception as e:
-            logger.error(f"Error creating diagnosis session: {e}")
+            logger.error("Error creating diagnosis session: %s", e)
             self.db.rollback()
             raise
     
@@ -78,19 +102,10 @@ class DiagnosisSessionService:
                 ChatMessage.session_id == session.id
             ).scalar()
             
-            return ChatSessionResponse(
-                id=session.id,
-                user_id=session.user_id,
-                session_name=session.session_name,
-                patient_summary=session.patient_summary,
-                is_active=session.is_active,
-                created_at=session.created_at,
-                updated_at=session.updated_at,
-                message_count=message_count or 0
-            )
+            return session_to_response(session, message_count)
             
         except Exception as e:
-            logger.error(f"Error getting diagnosis session {session_id}: {e}")
+            logger.error("Error getting diagnosis session %s: %s", session_id, e)
             raise
     
     def get_session_with_messages(self, session_id: int, user: User) -> Optional[ChatSessionWithMessages]:
@@ -111,18 +126,10 @@ class DiagnosisSessionService:
             
             # Convert messages to response format
             message_responses = [
-                ChatMessageResponse(
-                    id=msg.id,
-                    session_id=msg.session_id,
-                    message_type=msg.message_type,
-                    content=msg.content,
-                    patient_data=msg.patient_data,
-                    diagnosis_complete=msg.diagnosis_complete,
-                    created_at=msg.created_at
-                ) for msg in messages
+                message_to_response(msg) for msg in messages
             ]
             
-            return ChatSessionWithMessages(
+            return ChatSessionWithMessages.model_construct(
                 id=session.id,
                 user_id=session.user_id,
                 session_name=session.session_name,
@@ -135,7 +142,7 @@ class DiagnosisSessionService:
             )
             
         except Exception as e:
-            logger.error(f"Error getting diagnosis session with messages {session_id}: {e}")
+            logger.error("Error getting diagnosis session with messages %s: %s", session_id, e)
             raise
     
     def list_sessions(self, user: User, page: int = 1, per_page: int = 20) -> ChatSessionListResponse:
@@ -165,16 +172,7 @@ class DiagnosisSessionService:
             
             # Convert to response format
             session_responses = [
-                ChatSessionResponse(
-                    id=session.id,
-                    user_id=session.user_id,
-                    session_name=session.session_name,
-                    patient_summary=session.patient_summary,
-                    is_active=session.is_active,
-                    created_at=session.created_at,
-                    updated_at=session.updated_at,
-                    message_count=message_count or 0
-                ) for session, message_count in sessions
+                session_to_response(session, message_count) for session, message_count in sessions
             ]
             
             return ChatSessionListResponse(
@@ -185,7 +183,7 @@ class DiagnosisSessionService:
             )
             
         except Exception as e:
-            logger.error(f"Error listing diagnosis sessions for user {user.id}: {e}")
+            logger.error("Error listing diagnosis sessions for user %s: %s", user.id, e)
             raise
     
     def update_session(self, session_id: int, user: User, update_data: ChatSessionUpdate) -> Optional[ChatSessionResponse]:
@@ -217,21 +215,12 @@ class DiagnosisSessionService:
                 ChatMessage.session_id == session.id
             ).scalar()
             
-            logger.info(f"Updated diagnosis session {session_id} for user {user.id}")
+            logger.info("Updated diagnosis session %s for user %s", session_id, user.id)
             
-            return ChatSessionResponse(
-                id=session.id,
-                user_id=session.user_id,
-                session_name=session.session_name,
-                patient_summary=session.patient_summary,
-                is_active=session.is_active,
-                created_at=session.created_at,
-                updated_at=session.updated_at,
-                message_count=message_count or 0
-            )
+            return session_to_response(session, message_count)
             
         except Exception as e:
-            logger.error(f"Error updating diagnosis session {session_id}: {e}")
+            logger.error("Error updating diagnosis session %s: %s", session_id, e)
             self.db.rollback()
             raise
     
@@ -249,11 +238,11 @@ class DiagnosisSessionService:
             self.db.delete(session)
             self.db.commit()
             
-            logger.info(f"Deleted diagnosis session {session_id} for user {user.id}")
+            logger.info("Deleted diagnosis session %s for user %s", session_id, user.id)
             return True
             
         except Exception as e:
-            logger.error(f"Error deleting diagnosis session {session_id}: {e}")
+            logger.error("Error deleting diagnosis session %s: %s", session_id, e)
             self.db.rollback()
             raise
     
@@ -270,37 +259,30 @@ class DiagnosisSessionService:
                 return None
             
             # Create new message
+            now = datetime.utcnow().isoformat()
             new_message = ChatMessage(
                 session_id=session_id,
                 message_type=message_data.message_type,
                 content=message_data.content,
                 patient_data=message_data.patient_data,
                 diagnosis_complete=message_data.diagnosis_complete,
-                created_at=datetime.utcnow().isoformat()
+                created_at=now
             )
             
             self.db.add(new_message)
             
             # Update session timestamp
-            session.updated_at = datetime.utcnow().isoformat()
+            session.updated_at = now
             
             self.db.commit()
             self.db.refresh(new_message)
             
-            logger.info(f"Added message {new_message.id} to session {session_id}")
+            logger.info("Added message %s to session %s", new_message.id, session_id)
             
-            return ChatMessageResponse(
-                id=new_message.id,
-                session_id=new_message.session_id,
-                message_type=new_message.message_type,
-                content=new_message.content,
-                patient_data=new_message.patient_data,
-                diagnosis_complete=new_message.diagnosis_complete,
-                created_at=new_message.created_at
-            )
+            return message_to_response(new_message)
             
         except Exception as e:
-            logger.error(f"Error adding message to session {session_id}: {e}")
+            logger.error("Error adding message to session %s: %s", session_id, e)
             self.db.rollback()
             raise
     
@@ -333,6 +315,6 @@ class DiagnosisSessionService:
             return "\n".join(chat_history_parts)
             
         except Exception as e:
-            logger.error(f"Error getting chat history for session {session_id}: {e}")
+            logger.error("Error getting chat history for session %s: %s", session_id, e)
             return ""
             
\ No newline at end of file
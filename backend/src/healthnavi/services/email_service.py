@@ -11,7 +11,6 @@ from email.mime.multipart import MIMEMultipart
 from typing import Optional
 import os
 import secrets
-import string
 
 logger = logging.getLogger(__name__)
 
@@ -31,17 +30,16 @@ class EmailService:
         # Check if email is configured
         if not self.sender_email or not self.sender_password:
             logger.warning("Email service not configured - SMTP credentials missing")
-            logger.warning(f"SMTP_USERNAME: {'SET' if self.sender_email else 'NOT SET'}")
-            logger.warning(f"SMTP_PASSWORD: {'SET' if self.sender_password else 'NOT SET'}")
+            logger.warning("SMTP_USERNAME: %s", 'SET' if self.sender_email else 'NOT SET')
+            logger.warning("SMTP_PASSWORD: %s", 'SET' if self.sender_password else 'NOT SET')
             self.is_configured = False
         else:
             self.is_configured = True
-            logger.info(f"Email service configured with {self.sender_email}")
+            logger.info("Email service configured with %s", self.sender_email)
     
     def generate_verification_token(self, length: int = 32) -> str:
-        """Generate a secure verification token."""
-        alphabet = string.ascii_letters + string.digits
-        return ''.join(secrets.choice(alphabet) for _ in range(length))
+        """Generate a secure URL-safe verification token from `length` random bytes."""
+        return secrets.token_urlsafe(length)
     
     def send_verification_email(self, email: str, username: str, verification_token: str) -> bool:
         """Send email verification email."""
@@ -110,11 +108,11 @@ class EmailService:
                 server.login(self.sender_email, self.sender_password)
                 server.sendmail(self.sender_email, email, message.as_string())
             
-            logger.info(f"Verification email sent to {email}")
+            logger.info("Verification email sent to %s", email)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send verification email to {email}: {str(e)}")
+            logger.error("Failed to send verification email to %s: %s", email, e)
             return False
     
     def send_password_reset_email(self, email: str, username: str, reset_token: str) -> bool:
@@ -185,11 +183,11 @@ class EmailService:
                 server.login(self.sender_email, self.sender_password)
                 server.sendmail(self.sender_email, email, message.as_string())
             
-            logger.info(f"Password reset email sent to {email}")
+            logger.info("Password reset email sent to %s", email)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send password reset email to {email}: {str(e)}")
+            logger.error("Failed to send password reset email to %s: %s", email, e)
             return False
 
 
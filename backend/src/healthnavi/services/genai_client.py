@@ -25,18 +25,18 @@ def initialize_vertexai():
         location = os.getenv("GOOGLE_CLOUD_LOCATION") or os.getenv("GCP_LOCATION")
         service_account_file = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
         
-        logger.info(f"Initializing Vertex AI with project: {project_id}, location: {location}")
+        logger.info("Initializing Vertex AI with project: %s, location: %s", project_id, location)
         
         if service_account_file:
-            logger.info(f"Attempting to load credentials from: {service_account_file}")
+            logger.info("Attempting to load credentials from: %s", service_account_file)
             
             if os.path.exists(service_account_file):
                 logger.info("Service account file exists, loading credentials...")
                 credentials, project_id = load_credentials_from_file(service_account_file)
                 vertexai.init(project=project_id, location=location, credentials=credentials)
-                logger.info(f"Successfully loaded credentials from file for project: {project_id}")
+                logger.info("Successfully loaded credentials from file for project: %s", project_id)
             else:
-                logger.error(f"Service account file not found at: {service_account_file}")
+                logger.error("Service account file not found at: %s", service_account_file)
                 logger.info("Falling back to application default credentials...")
                 vertexai.init(project=project_id, location=location)
         else:
@@ -46,8 +46,8 @@ def initialize_vertexai():
         logger.info("Vertex AI initialization completed successfully")
         
     except Exception as e:
-        logger.error(f"Failed to initialize Vertex AI: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.error("Failed to initialize Vertex AI: %s", e)
+        logger.error("Traceback: %s", traceback.format_exc())
         raise
 
 def initialize_genai_client():
@@ -88,10 +88,10 @@ def initialize_genai_client():
             location=effective_location
         )
         
-        logger.info(f"GenAI client initialized successfully for project {project_id} in {effective_location}")
+        logger.info("GenAI client initialized successfully for project %s in %s", project_id, effective_location)
         
     except Exception as e:
-        logger.error(f"Failed to initialize GenAI client: {str(e)}")
+        logger.error("Failed to initialize GenAI client: %s", e)
         raise
 
 def get_genai_client():
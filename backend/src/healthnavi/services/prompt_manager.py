@@ -56,9 +56,9 @@ class PromptManager:
         ]
         
         for path in possible_paths:
-            logger.info(f"Checking config path: {path}")
+            logger.info("Checking config path: %s", path)
             if path.exists() and (path / "prompts").exists():
-                logger.info(f"Found config directory at: {path}")
+                logger.info("Found config directory at: %s", path)
                 return path
         
         logger.warning("Could not find config directory, using fallback")
@@ -68,10 +68,10 @@ class PromptManager:
         """Load all prompt templates from JSON files."""
         prompts_dir = self.config_dir / "prompts"
         
-        logger.info(f"Loading prompts from: {prompts_dir}")
+        logger.info("Loading prompts from: %s", prompts_dir)
         
         if not prompts_dir.exists():
-            logger.warning(f"Prompts directory not found: {prompts_dir}")
+            logger.warning("Prompts directory not found: %s", prompts_dir)
             self._load_default_prompts()
             return
         
@@ -85,10 +85,10 @@ class PromptManager:
         for filename, query_type in prompt_files.items():
             file_path = prompts_dir / filename
             
-            logger.info(f"Loading prompt file: {file_path}")
+            logger.info("Loading prompt file: %s", file_path)
             
             if not file_path.exists():
-                logger.warning(f"Prompt file not found: {file_path}")
+                logger.warning("Prompt file not found: %s", file_path)
                 continue
             
             try:
@@ -105,15 +105,15 @@ class PromptManager:
                 )
                 
                 self.prompts[query_type] = prompt_config
-                logger.info(f"✅ Loaded prompt [{query_type.value}] v{prompt_config.version}: {len(prompt_config.template)} chars")
+                logger.info("✅ Loaded prompt [%s] v%s: %s chars", query_type.value, prompt_config.version, len(prompt_config.template))
                 
             except Exception as e:
-                logger.error(f"Failed to load prompt {filename}: {e}")
+                logger.error("Failed to load prompt %s: %s", filename, e)
         
         # Add default prompts for missing types
         self._add_default_prompts()
         
-        logger.info(f"Total prompts loaded: {len(self.prompts)}")
+        logger.info("Total prompts loaded: %s", len(self.prompts))
     
     def _add_default_prompts(self) -> None:
         """Add default prompts for missing query types."""
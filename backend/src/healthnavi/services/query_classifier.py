@@ -30,8 +30,18 @@ class QueryClassifier:
     def __init__(self):
         """Initialize the query classifier."""
         self.rules: List[ClassificationRule] = []
+        # Compiled rule patterns, highest confidence first
+        self._ranked_patterns: List[Tuple[re.Pattern, ClassificationRule]] = []
         self._load_classification_rules()
     
+    def _rank_rules(self) -> None:
+        """Compile the rule patterns once and order them by descending confidence."""
+        # sorted() is stable, so equally confident rules keep their declaration order
+        self._ranked_patterns = [
+            (re.compile(rule.pattern, re.IGNORECASE), rule)
+            for rule in sorted(self.rules, key=lambda rule: rule.confidence, reverse=True)
+        ]
+    
     def _load_classification_rules(self) -> None:
         """Load classification rules."""
         logger.info("Loading query classification rules...")
@@ -95,7 +105,8 @@ class QueryClassifier:
             )
         ]
         
-        logger.info(f"Loaded {len(self.rules)} classification rules")
+        self._rank_rules()
+        logger.info("Loaded %s classification rules", len(self.rules))
     
     def classify_query(self, query: str, patient_data: str = "") -> Tuple[QueryType, float]:
         """Classify a query into a specific type."""
@@ -103,23 +114,24 @@ class QueryClassifier:
             return QueryType.GENERAL_QUERY, 0.0
         
         # Combine query and patient data for better classification
-        combined_text = f"{query} {patient_data}".lower()
+        combined_text = f"{query} {patient_data}"
         
         best_match = None
         best_confidence = 0.0
         
-        for rule in self.rules:
-            if re.search(rule.pattern, combined_text, re.IGNORECASE):
-                if rule.confidence > best_confidence:
-                    best_match = rule.query_type
-                    best_confidence = rule.confidence
+        # Rules are ranked by confidence, so the first match is the best one
+        for pattern, rule in self._ranked_patterns:
+            if pattern.search(combined_text):
+                best_match = rule.query_type
+                best_confidence = rule.confidence
+                break
         
         # If no specific match found, use general query
         if best_match is None:
             best_match = QueryType.GENERAL_QUERY
             best_confidence = 0.1
         
-        logger.info(f"Classified query as {best_match} with confidence {best_confidence}")
+        logger.info("Classified query as %s with confidence %s", best_match, best_confidence)
         return best_match, best_confidence
     
     def get_classification_rules(self) -> List[ClassificationRule]:
@@ -129,7 +141,8 @@ class QueryClassifier:
     def add_classification_rule(self, rule: ClassificationRule) -> None:
         """Add a new classification rule."""
         self.rules.append(rule)
-        logger.info(f"Added classification rule: {rule.description}")
+        self._rank_rules()
+        logger.info("Added classification rule: %s", rule.description)
 
 
 # Global query classifier instance
@@ -6,11 +6,25 @@ This module handles processing and formatting AI responses.
 
 import json
 import logging
+import re
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# JSON wrapped in markdown code blocks
+JSON_BLOCK_PATTERN = re.compile(r'```(?:json)?\s*\n?(.*?)\n?```', re.DOTALL | re.IGNORECASE)
+
+# Source citations in free-text responses
+SOURCE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\[Source: ([^\]]+)\]",
+        r"Source: ([^\n]+)",
+        r"Reference: ([^\n]+)"
+    )
+)
+
 
 @dataclass
 class ProcessedResponse:
@@ -39,7 +53,7 @@ class ResponseProcessor:
                 return self._process_text_response(raw_response, query_type)
         
         except Exception as e:
-            logger.error(f"Error processing response: {e}")
+            logger.error("Error processing response: %s", e)
             return ProcessedResponse(
                 content=raw_response,
                 format_type="text",
@@ -62,11 +76,8 @@ class ResponseProcessor:
     
     def _extract_json_from_markdown(self, response: str) -> Optional[str]:
         """Extract JSON from markdown code blocks."""
-        import re
-        
         # Look for JSON in markdown code blocks
-        json_pattern = r'```(?:json)?\s*\n?(.*?)\n?```'
-        matches = re.findall(json_pattern, response, re.DOTALL | re.IGNORECASE)
+        matches = JSON_BLOCK_PATTERN.findall(response)
         
         for match in matches:
             try:
@@ -120,7 +131,7 @@ class ResponseProcessor:
                 )
         
         except Exception as e:
-            logger.error(f"Error processing JSON response: {e}")
+            logger.error("Error processing JSON response: %s", e)
             return ProcessedResponse(
                 content=response,
                 format_type="json",
@@ -251,16 +262,8 @@ class ResponseProcessor:
         sources = []
         
         # Look for source patterns
-        import re
-        source_patterns = [
-            r"\[Source: ([^\]]+)\]",
-            r"Source: ([^\n]+)",
-            r"Reference: ([^\n]+)"
-        ]
-        
-        for pattern in source_patterns:
-            matches = re.findall(pattern, response, re.IGNORECASE)
-            sources.extend(matches)
+        for pattern in SOURCE_PATTERNS:
+            sources.extend(pattern.findall(response))
         
         return list(set(sources))  # Remove duplicates
     
@@ -34,25 +34,25 @@ class ZillizService:
             self.azure_deployment = os.getenv('DEPLOYMENT', 'text-embedding-3-large')
             logger.info("Milvus and Azure OpenAI clients initialized successfully.")
         except Exception as e:
-            logger.error(f"Failed to initialize clients: {e}")
+            logger.error("Failed to initialize clients: %s", e)
             raise
 
     def check_collection_exists(self) -> bool:
         """Checks if the configured collection exists in Zilliz."""
         try:
             exists = self.client.has_collection(self.collection_name)
-            logger.info(f"Collection '{self.collection_name}' exists: {exists}")
+            logger.info("Collection '%s' exists: %s", self.collection_name, exists)
             return exists
         except Exception as e:
-            logger.error(f"Error checking for collection '{self.collection_name}': {e}")
+            logger.error("Error checking for collection '%s': %s", self.collection_name, e)
             return False
 
     def generate_query_embedding(self, query: str) -> list[float]:
         """Generates a 3072-dim embedding for the query using Azure OpenAI."""
         try:
-            embedding_start = time.time()
+            embedding_start = time.perf_counter()
             query_length = len(query)
-            logger.info(f"🔢 Starting embedding generation for query ({query_length} chars)...")
+            logger.info("🔢 Starting embedding generation for query (%s chars)...", query_length)
             
             response = self.azure_client.embeddings.create(
                 input=[query],
@@ -60,11 +60,11 @@ class ZillizService:
             )
             embedding = response.data[0].embedding
             
-            embedding_time = time.time() - embedding_start
-            logger.info(f"✨ Embedding generation completed in {embedding_time:.3f}s - Vector dim: {len(embedding)}")
+            embedding_time = time.perf_counter() - embedding_start
+            logger.info("✨ Embedding generation completed in %.3fs - Vector dim: %s", embedding_time, len(embedding))
             return embedding
         except Exception as e:
-            logger.error(f"Failed to generate query embedding: {e}")
+            logger.error("Failed to generate query embedding: %s", e)
             raise
 
     def _apply_mmr_diversity_reranking(self, search_results: list, k: int, lambda_param: float = 0.5) -> list:
@@ -96,8 +96,8 @@ class ZillizService:
             query: Search query text
             k: Number of results to return
         """
-        search_total_start = time.time()
-        logger.info(f"🔍 Starting medical knowledge search (k={k})...")
+        search_total_start = time.perf_counter()
+        logger.info("🔍 Starting medical knowledge search (k=%s)...", k)
         
         if not self.check_collection_exists():
             logger.error("Collection not found.")
@@ -105,13 +105,13 @@ class ZillizService:
 
         try:
             # Step 1: Generate query embedding client-side
-            embedding_start = time.time()
+            embedding_start = time.perf_counter()
             query_embedding = self.generate_query_embedding(query)
-            embedding_time = time.time() - embedding_start
+            embedding_time = time.perf_counter() - embedding_start
 
             retrieve_k = min(k * 3, 100)
-            vector_search_start = time.time()
-            logger.info(f"🎯 Vector search in '{self.collection_name}' (retrieving {retrieve_k}, returning {k})...")
+            vector_search_start = time.perf_counter()
+            logger.info("🎯 Vector search in '%s' (retrieving %s, returning %s)...", self.collection_name, retrieve_k, k)
             
             search_results = self.client.search(
                 collection_name=self.collection_name,
@@ -121,25 +121,25 @@ class ZillizService:
                 search_params={"metric_type": "COSINE"}
             )
             
-            vector_search_time = time.time() - vector_search_start
-            logger.info(f"🎯 Vector search completed in {vector_search_time:.3f}s")
+            vector_search_time = time.perf_counter() - vector_search_start
+            logger.info("🎯 Vector search completed in %.3fs", vector_search_time)
 
             if not search_results or not search_results[0]:
                 logger.warning("No relevant medical information found.")
                 return "No relevant medical information found in the knowledge base.", []
 
             # Step 3: Apply MMR diversity reranking
-            rerank_start = time.time()
+            rerank_start = time.perf_counter()
             reranked_results = self._apply_mmr_diversity_reranking(
                 search_results[0], 
                 k, 
                 lambda_param=0.5
             )
-            rerank_time = time.time() - rerank_start
-            logger.info(f"🔄 MMR diversity reranking completed in {rerank_time:.3f}s")
+            rerank_time = time.perf_counter() - rerank_start
+            logger.info("🔄 MMR diversity reranking completed in %.3fs", rerank_time)
 
             # Step 4: Process and format results
-            processing_start = time.time()
+            processing_start = time.perf_counter()
             reranked_entities = []
             sources = set()
             total_content_length = 0
@@ -152,9 +152,9 @@ class ZillizService:
                 
                 # Debug: Log first result to see structure (only once per search)
                 if idx == 0:
-                    logger.info(f"🔍 DEBUG - First hit structure: {list(hit.keys())}")
-                    logger.info(f"🔍 DEBUG - Entity keys: {list(entity.keys())}")
-                    logger.info(f"🔍 DEBUG - Payload (first 200 chars): {payload_str[:200]}")
+                    logger.info("🔍 DEBUG - First hit structure: %s", list(hit.keys()))
+                    logger.info("🔍 DEBUG - Entity keys: %s", list(entity.keys()))
+                    logger.info("🔍 DEBUG - Payload (first 200 chars): %s", payload_str[:200])
                 
                 # Parse the payload JSON string
                 try:
@@ -162,7 +162,7 @@ class ZillizService:
                     
                     # Debug: Log payload keys
                     if idx == 0:
-                        logger.info(f"🔍 DEBUG - Parsed payload keys: {list(payload.keys()) if isinstance(payload, dict) else 'Not a dict'}")
+                        logger.info("🔍 DEBUG - Parsed payload keys: %s", list(payload.keys()) if isinstance(payload, dict) else 'Not a dict')
                     
                     # Handle both new format (with chunk_text) and old format (without)
                     # New format: has 'chunk_text' field
@@ -172,8 +172,8 @@ class ZillizService:
                     # If no chunk_text, this is old format data - log a warning
                     if not content:
                         if idx == 0:
-                            logger.warning(f"⚠️  Old format detected: payload missing 'chunk_text' field. Data needs re-ingestion.")
-                            logger.warning(f"⚠️  Available fields: {list(payload.keys())}")
+                            logger.warning("⚠️  Old format detected: payload missing 'chunk_text' field. Data needs re-ingestion.")
+                            logger.warning("⚠️  Available fields: %s", list(payload.keys()))
                         continue
                     
                     # Extract other fields with fallbacks
@@ -192,41 +192,41 @@ class ZillizService:
                     total_content_length += len(content)
                         
                 except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse payload JSON: {str(e)} - {payload_str[:100]}...")
+                    logger.warning("Failed to parse payload JSON: %s - %s...", e, payload_str[:100])
                     continue
                 except Exception as e:
-                    logger.warning(f"Error processing hit {idx}: {str(e)}")
+                    logger.warning("Error processing hit %s: %s", idx, e)
                     continue
 
-            processing_time = time.time() - processing_start
+            processing_time = time.perf_counter() - processing_start
 
             if not reranked_entities:
                 logger.warning("No relevant content extracted from search results.")
                 return [], []
 
-            search_total_time = time.time() - search_total_start
+            search_total_time = time.perf_counter() - search_total_start
             
             # Detailed timing breakdown for search operation
-            logger.info(f"📊 SEARCH TIMING BREAKDOWN:")
-            logger.info(f"   ├── Embedding Generation: {embedding_time:.3f}s ({embedding_time/search_total_time*100:.1f}%)")
-            logger.info(f"   ├── Vector Search: {vector_search_time:.3f}s ({vector_search_time/search_total_time*100:.1f}%)")
-            logger.info(f"   ├── MMR Reranking: {rerank_time:.3f}s ({rerank_time/search_total_time*100:.1f}%)")
-            logger.info(f"   └── Result Processing: {processing_time:.3f}s ({processing_time/search_total_time*100:.1f}%)")
-            logger.info(f"✅ Search completed in {search_total_time:.3f}s - Retrieved {len(reranked_entities)} chunks ({total_content_length} chars) from {len(sources)} unique sources")
+            logger.info("📊 SEARCH TIMING BREAKDOWN:")
+            logger.info("   ├── Embedding Generation: %.3fs (%.1f%%)", embedding_time, embedding_time/search_total_time*100)
+            logger.info("   ├── Vector Search: %.3fs (%.1f%%)", vector_search_time, vector_search_time/search_total_time*100)
+            logger.info("   ├── MMR Reranking: %.3fs (%.1f%%)", rerank_time, rerank_time/search_total_time*100)
+            logger.info("   └── Result Processing: %.3fs (%.1f%%)", processing_time, processing_time/search_total_time*100)
+            logger.info("✅ Search completed in %.3fs - Retrieved %s chunks (%s chars) from %s unique sources", search_total_time, len(reranked_entities), total_content_length, len(sources))
             
             return reranked_entities, sorted(list(sources))
 
         except Exception as e:
-            logger.error(f"Error during search in '{self.collection_name}': {e}")
+            logger.error("Error during search in '%s': %s", self.collection_name, e)
             return f"An error occurred during search: {str(e)}", []
 
     def load_collection(self):
         """Loads the collection into memory for faster searches."""
         try:
             self.client.load_collection(self.collection_name)
-            logger.info(f"Collection '{self.collection_name}' loaded successfully.")
+            logger.info("Collection '%s' loaded successfully.", self.collection_name)
         except Exception as e:
-            logger.error(f"Failed to load collection '{self.collection_name}': {e}")
+            logger.error("Failed to load collection '%s': %s", self.collection_name, e)
             raise
 
 vectordb_service = ZillizService()
@@ -1,9 +1,12 @@
 from healthnavi.services.vectordb_service import ZillizService
-from typing import Tuple, List
+from healthnavi.core.constants import RETRIEVAL_CACHE_TTL_SECONDS, RETRIEVAL_CACHE_MAX_SIZE
+from typing import Optional, Tuple, List
 import time
+import hashlib
 import logging
 import os
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 
 logging.basicConfig(
     level=logging.INFO,
@@ -16,6 +19,34 @@ logger = logging.getLogger(__name__)
 vectordb_service = ZillizService()
 vectorstore_initialized = False
 
+# LRU cache of retrieval results: key -> (top_chunks, sources, cached_at).
+# Retrieval runs in worker threads, so access is guarded by a lock.
+RETRIEVAL_CACHE: "OrderedDict[tuple, Tuple[List, List[str], float]]" = OrderedDict()
+_retrieval_cache_lock = threading.Lock()
+
+
+def _get_cached_retrieval(cache_key: tuple) -> Optional[Tuple[List, List[str]]]:
+    """Get cached chunks and sources for a retrieval if available and not expired."""
+    with _retrieval_cache_lock:
+        entry = RETRIEVAL_CACHE.get(cache_key)
+        if entry is None:
+            return None
+        top_chunks, sources, cached_at = entry
+        if time.monotonic() - cached_at >= RETRIEVAL_CACHE_TTL_SECONDS:
+            del RETRIEVAL_CACHE[cache_key]
+            return None
+        RETRIEVAL_CACHE.move_to_end(cache_key)
+        return list(top_chunks), list(sources)
+
+
+def _cache_retrieval(cache_key: tuple, top_chunks: List, sources: List[str]) -> None:
+    """Cache a retrieval result, evicting the least recently used entries."""
+    with _retrieval_cache_lock:
+        RETRIEVAL_CACHE[cache_key] = (list(top_chunks), list(sources), time.monotonic())
+        RETRIEVAL_CACHE.move_to_end(cache_key)
+        while len(RETRIEVAL_CACHE) > RETRIEVAL_CACHE_MAX_SIZE:
+            RETRIEVAL_CACHE.popitem(last=False)
+
 def initialize_vectorstore():
     """Initializes and loads the Zilliz collection at startup."""
     global vectorstore_initialized
@@ -42,7 +73,7 @@ def search_all_collections(
     Perform semantic retrieval and return optimized context for LLM.
     - Retrieves chunks with diversity across multiple sources.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     client = vectordb_service.client
     collection_name = vectordb_service.collection_name
 
@@ -51,7 +82,18 @@ def search_all_collections(
         raise RuntimeError("Vector store not initialized. Call initialize_vectorstore() first.")
 
     full_search_query = f"{query.strip()}\n{patient_data.strip()}".strip()
-    logger.info(f"🔍 Running semantic retrieval (query length={len(full_search_query)})")
+
+    # Identical searches with the same selection limits return the same context
+    cache_key = (
+        hashlib.blake2b(full_search_query.encode(), digest_size=16).digest(),
+        max_chunks, max_books, min_chunks, min_books
+    )
+    cached = _get_cached_retrieval(cache_key)
+    if cached:
+        logger.info("⚡ Retrieval cache hit in %.3fs", time.perf_counter() - start_time)
+        return cached
+
+    logger.info("🔍 Running semantic retrieval (query length=%s)", len(full_search_query))
 
     try:
         # Retrieve more chunks to ensure diversity across multiple sources
@@ -79,12 +121,14 @@ def search_all_collections(
             file_name = file_name.replace('.pdf', '').replace('_', ' ').replace('-', ' ')
             unique_top_sources.add(file_name)
 
-        total_time = time.time() - start_time
-        logger.info(f"📚 Retrieved {len(top_chunks)} top chunks in {total_time:.2f}s from {len(unique_top_sources)} sources.")
-        return top_chunks, list(unique_top_sources)
+        total_time = time.perf_counter() - start_time
+        logger.info("📚 Retrieved %s top chunks in %.2fs from %s sources.", len(top_chunks), total_time, len(unique_top_sources))
+        sources = list(unique_top_sources)
+        _cache_retrieval(cache_key, top_chunks, sources)
+        return top_chunks, sources
 
     except Exception as e:
-        logger.error(f"❌ Error during search_all_collections: {e}", exc_info=True)
+        logger.error("❌ Error during search_all_collections: %s", e, exc_info=True)
         return [], []
 
 
@@ -117,7 +161,7 @@ def _apply_book_diversity(
     
     # If we have fewer books than min_books, just return top chunks up to max_chunks
     if available_books < min_books:
-        logger.warning(f"Only {available_books} books found, less than minimum {min_books}")
+        logger.warning("Only %s books found, less than minimum %s", available_books, min_books)
         return chunks[:target_chunks]
     
     # Distribute chunks across books round-robin to ensure diversity
@@ -151,6 +195,6 @@ def _apply_book_diversity(
             break
     
     final_books = len(set(os.path.basename(c.get('file_path', '')) for c in selected_chunks))
-    logger.info(f"📖 Diversity selection: {len(selected_chunks)} chunks from {final_books} different books")
+    logger.info("📖 Diversity selection: %s chunks from %s different books", len(selected_chunks), final_books)
     return selected_chunks
     
\ No newline at end of file